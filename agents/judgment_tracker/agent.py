@@ -48,6 +48,25 @@ class JudgmentTrackerAgent(LienOSBaseAgent):
 
     async def _create_judgment(self, context: AgentContext) -> Dict[str, Any]:
         """Create a new civil judgment"""
+        judgment = self._build_judgment(context)
+        judgment_id = judgment.asset_id
+        params = context.parameters
+
+        # Save to storage
+        judgment_dict = judgment.model_dump()
+        judgment_dict["id"] = judgment_id
+        await self.storage.create("judgments", judgment_dict, context.tenant_id)
+
+        self.log_info(f"Created judgment {judgment_id} for case {params['case_number']}")
+
+        return {
+            "asset_id": judgment_id,
+            "status": "created",
+            "data": judgment_dict
+        }
+
+    def _build_judgment(self, context: AgentContext) -> CivilJudgment:
+        """Validate create parameters and build the CivilJudgment model, without saving it"""
         params = context.parameters
         
         # Validate required fields
@@ -91,18 +110,7 @@ class JudgmentTrackerAgent(LienOSBaseAgent):
             updated_at=datetime.now()
         )
 
-        # Save to storage
-        judgment_dict = judgment.model_dump()
-        judgment_dict["id"] = judgment_id
-        await self.storage.create("judgments", judgment_dict, context.tenant_id)
-
-        self.log_info(f"Created judgment {judgment_id} for case {params['case_number']}")
-
-        return {
-            "asset_id": judgment_id,
-            "status": "created",
-            "data": judgment_dict
-        }
+        return judgment
 
     async def _get_judgment(self, context: AgentContext) -> Dict[str, Any]:
         """Get a judgment by ID"""
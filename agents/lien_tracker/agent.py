@@ -77,6 +77,44 @@ class LienTrackerAgent(LienOSBaseAgent):
         Returns:
             Dict with created lien details
         """
+        lien = self._build_lien(context)
+        lien_id = lien.asset_id
+        params = context.parameters
+
+        # Save to storage
+        lien_dict = lien.model_dump()
+        lien_dict["id"] = lien_id  # Ensure document ID matches asset_id
+        await self.storage.create("liens", lien_dict, context.tenant_id)
+
+        self.log_info(f"Created lien {lien_id} for {params['property_address']}")
+
+        # Automatically create redemption deadline using DeadlineAlertAgent
+        deadline_agent = DeadlineAlertAgent(storage=self.storage)
+        deadline_result = await deadline_agent.run(
+            tenant_id=context.tenant_id,
+            task="create_deadline",
+            lien_ids=[lien_id]
+        )
+
+        self.log_info(f"Created deadline for lien {lien_id}")
+
+        return {
+            "lien_id": lien_id,
+            "certificate_number": lien.certificate_number,
+            "purchase_amount": float(lien.purchase_amount),
+            "interest_rate": float(lien.interest_rate),
+            "sale_date": lien.sale_date.isoformat(),
+            "redemption_deadline": lien.redemption_deadline.isoformat(),
+            "status": lien.status.value,
+            "county": lien.county,
+            "property_address": lien.property_address,
+            "parcel_id": lien.parcel_id,
+            "created": True,
+            "deadline_id": deadline_result.get("deadline_id")
+        }
+
+    def _build_lien(self, context: AgentContext) -> Lien:
+        """Validate create parameters and build the Lien model, without saving it"""
         params = context.parameters
 
         # Validate required fields
@@ -121,37 +159,7 @@ class LienTrackerAgent(LienOSBaseAgent):
             updated_at=datetime.utcnow()
         )
 
-        # Save to storage
-        lien_dict = lien.model_dump()
-        lien_dict["id"] = lien_id  # Ensure document ID matches asset_id
-        await self.storage.create("liens", lien_dict, context.tenant_id)
-
-        self.log_info(f"Created lien {lien_id} for {params['property_address']}")
-
-        # Automatically create redemption deadline using DeadlineAlertAgent
-        deadline_agent = DeadlineAlertAgent(storage=self.storage)
-        deadline_result = await deadline_agent.run(
-            tenant_id=context.tenant_id,
-            task="create_deadline",
-            lien_ids=[lien_id]
-        )
-
-        self.log_info(f"Created deadline for lien {lien_id}")
-
-        return {
-            "lien_id": lien_id,
-            "certificate_number": lien.certificate_number,
-            "purchase_amount": float(lien.purchase_amount),
-            "interest_rate": float(lien.interest_rate),
-            "sale_date": lien.sale_date.isoformat(),
-            "redemption_deadline": lien.redemption_deadline.isoformat(),
-            "status": lien.status.value,
-            "county": lien.county,
-            "property_address": lien.property_address,
-            "parcel_id": lien.parcel_id,
-            "created": True,
-            "deadline_id": deadline_result.get("deadline_id")
-        }
+        return lien
 
     async def _update_lien(self, context: AgentContext) -> Dict[str, Any]:
         """
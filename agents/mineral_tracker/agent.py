@@ -49,6 +49,24 @@ class MineralTrackerAgent(LienOSBaseAgent):
 
     async def _create_mineral(self, context: AgentContext) -> Dict[str, Any]:
         """Create a new mineral right"""
+        mineral = self._build_mineral(context)
+        mineral_id = mineral.asset_id
+
+        # Save to storage
+        mineral_dict = mineral.model_dump()
+        mineral_dict["id"] = mineral_id
+        await self.storage.create("minerals", mineral_dict, context.tenant_id)
+
+        self.log_info(f"Created mineral right {mineral_id}")
+
+        return {
+            "asset_id": mineral_id,
+            "status": "created",
+            "data": mineral_dict
+        }
+
+    def _build_mineral(self, context: AgentContext) -> MineralRight:
+        """Validate create parameters and build the MineralRight model, without saving it"""
         params = context.parameters
         
         # Validate required fields
@@ -71,8 +89,8 @@ class MineralTrackerAgent(LienOSBaseAgent):
             asset_id=mineral_id,
             tenant_id=context.tenant_id,
             legal_description=params["legal_description"],
-            net_mineral_acres=Decimal(str(params["net_mineral_acres"])),
-            royalty_decimal=Decimal(str(params["royalty_decimal"])),
+            net_mineral_acres=float(params["net_mineral_acres"]),
+            royalty_decimal=float(params["royalty_decimal"]),
             operator_name=params["operator_name"],
             purchase_amount=Decimal(str(params.get("purchase_amount", "0"))),
             interest_rate=Decimal(str(params.get("interest_rate", "0"))),
@@ -82,18 +100,7 @@ class MineralTrackerAgent(LienOSBaseAgent):
             updated_at=datetime.now()
         )
 
-        # Save to storage
-        mineral_dict = mineral.model_dump()
-        mineral_dict["id"] = mineral_id
-        await self.storage.create("minerals", mineral_dict, context.tenant_id)
-
-        self.log_info(f"Created mineral right {mineral_id}")
-
-        return {
-            "asset_id": mineral_id,
-            "status": "created",
-            "data": mineral_dict
-        }
+        return mineral
 
     async def _get_mineral(self, context: AgentContext) -> Dict[str, Any]:
         """Get a mineral right by ID"""
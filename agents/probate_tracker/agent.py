@@ -49,6 +49,25 @@ class ProbateTrackerAgent(LienOSBaseAgent):
 
     async def _create_probate(self, context: AgentContext) -> Dict[str, Any]:
         """Create a new probate estate"""
+        probate = self._build_probate(context)
+        probate_id = probate.asset_id
+        params = context.parameters
+
+        # Save to storage
+        probate_dict = probate.model_dump()
+        probate_dict["id"] = probate_id
+        await self.storage.create("probates", probate_dict, context.tenant_id)
+
+        self.log_info(f"Created probate {probate_id} for {params['deceased_name']}")
+
+        return {
+            "asset_id": probate_id,
+            "status": "created",
+            "data": probate_dict
+        }
+
+    def _build_probate(self, context: AgentContext) -> ProbateEstate:
+        """Validate create parameters and build the ProbateEstate model, without saving it"""
         params = context.parameters
         
         # Validate required fields
@@ -85,18 +104,7 @@ class ProbateTrackerAgent(LienOSBaseAgent):
             updated_at=datetime.now()
         )
 
-        # Save to storage
-        probate_dict = probate.model_dump()
-        probate_dict["id"] = probate_id
-        await self.storage.create("probates", probate_dict, context.tenant_id)
-
-        self.log_info(f"Created probate {probate_id} for {params['deceased_name']}")
-
-        return {
-            "asset_id": probate_id,
-            "status": "created",
-            "data": probate_dict
-        }
+        return probate
 
     async def _get_probate(self, context: AgentContext) -> Dict[str, Any]:
         """Get a probate by ID"""
@@ -49,6 +49,24 @@ class SurplusTrackerAgent(LienOSBaseAgent):
 
     async def _create_surplus(self, context: AgentContext) -> Dict[str, Any]:
         """Create a new surplus fund"""
+        surplus = self._build_surplus(context)
+        surplus_id = surplus.asset_id
+
+        # Save to storage
+        surplus_dict = surplus.model_dump()
+        surplus_dict["id"] = surplus_id
+        await self.storage.create("surplus_funds", surplus_dict, context.tenant_id)
+
+        self.log_info(f"Created surplus fund {surplus_id}")
+
+        return {
+            "asset_id": surplus_id,
+            "status": "created",
+            "data": surplus_dict
+        }
+
+    def _build_surplus(self, context: AgentContext) -> SurplusFund:
+        """Validate create parameters and build the SurplusFund model, without saving it"""
         params = context.parameters
         
         # Validate required fields
@@ -71,9 +89,9 @@ class SurplusTrackerAgent(LienOSBaseAgent):
             asset_id=surplus_id,
             tenant_id=context.tenant_id,
             foreclosure_date=params["foreclosure_date"],
-            winning_bid_amount=Decimal(str(params["winning_bid_amount"])),
-            total_debt_owed=Decimal(str(params["total_debt_owed"])),
-            surplus_amount=Decimal(str(params["surplus_amount"])),
+            winning_bid_amount=float(params["winning_bid_amount"]),
+            total_debt_owed=float(params["total_debt_owed"]),
+            surplus_amount=float(params["surplus_amount"]),
             claim_deadline=params["claim_deadline"],
             purchase_amount=Decimal(str(params.get("purchase_amount", "0"))),
             interest_rate=Decimal(str(params.get("interest_rate", "0"))),
@@ -83,18 +101,7 @@ class SurplusTrackerAgent(LienOSBaseAgent):
             updated_at=datetime.now()
         )
 
-        # Save to storage
-        surplus_dict = surplus.model_dump()
-        surplus_dict["id"] = surplus_id
-        await self.storage.create("surplus_funds", surplus_dict, context.tenant_id)
-
-        self.log_info(f"Created surplus fund {surplus_id}")
-
-        return {
-            "asset_id": surplus_id,
-            "status": "created",
-            "data": surplus_dict
-        }
+        return surplus
 
     async def _get_surplus(self, context: AgentContext) -> Dict[str, Any]:
         """Get a surplus fund by ID"""
@@ -6,6 +6,7 @@ REST API exposing all agent capabilities for tax lien management.
 
 import os
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 from datetime import date
 from decimal import Decimal
@@ -39,11 +40,19 @@ load_dotenv()
 # Load API Secret for authentication
 API_SECRET = os.getenv("ASSET_OS_SECRET")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release storage resources (Firestore executor and client) on shutdown."""
+    yield
+    await storage.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="LienOS API",
     description="REST API for tax lien management with AI-powered agents",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Enable CORS
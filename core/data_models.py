@@ -70,6 +70,16 @@ class Asset(BaseModel):
         }
     )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Asset":
+        """Validate a stored document dict directly with the compiled validator."""
+        return cls.__pydantic_validator__.validate_python(data)
+
+    @classmethod
+    def trusted(cls, data: Dict[str, Any]) -> "Asset":
+        """Build from already-validated data (e.g. our own stored documents) without re-validating."""
+        return cls.model_construct(**data)
+
     @field_serializer('purchase_amount', 'interest_rate')
     def serialize_decimal(self, value: Decimal, _info) -> float:
         """Serialize Decimal to float."""
@@ -145,6 +155,16 @@ class Payment(BaseModel):
         }
     )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Payment":
+        """Validate a stored document dict directly with the compiled validator."""
+        return cls.__pydantic_validator__.validate_python(data)
+
+    @classmethod
+    def trusted(cls, data: Dict[str, Any]) -> "Payment":
+        """Build from already-validated data (e.g. our own stored documents) without re-validating."""
+        return cls.model_construct(**data)
+
     @field_serializer('amount')
     def serialize_decimal(self, value: Decimal, _info) -> float:
         """Serialize Decimal to float."""
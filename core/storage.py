@@ -1,21 +1,87 @@
 """Storage abstraction for multi-tenant data access in LienOS."""
 
 import uuid
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple
 from datetime import datetime
 from decimal import Decimal
 import asyncio
 import logging
-
-# Try to import Google Cloud libraries, but allow local development without them
-try:
-    from google.cloud import firestore
-    GOOGLE_CLOUD_AVAILABLE = True
-except ImportError:
-    GOOGLE_CLOUD_AVAILABLE = False
+import operator
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached per-(collection, tenant) base queries
+BASE_QUERY_CACHE_SIZE = 10_000
+
+# Recently confirmed document owners, used to skip the pre-mutation read
+OWNER_CACHE_SIZE = 10_000
+OWNER_CACHE_TTL_SECONDS = 30.0
+
+# Max in-flight document RPCs for bulk operations
+BULK_CONCURRENCY = 64
+
+# Firestore's limit on writes per batch commit
+FIRESTORE_BATCH_LIMIT = 500
+
+
+# Query filter operators. Equality operators also match missing (None)
+# fields; range operators never do
+_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_EQUALITY_OPS = {"==", "!="}
+
+
+def _contains_decimal(data: Any) -> bool:
+    """Check whether data holds a Decimal anywhere in its nested dicts/lists."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Decimal):
+            return True
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+
+def _newest_first(docs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield creation-ordered documents newest first, lazily.
+
+    Documents sharing a created_at (e.g. one create_many batch) keep their
+    insertion order, matching a stable descending sort.
+    """
+    group: List[Dict[str, Any]] = []
+    for doc in reversed(docs):
+        if group and doc.get("created_at") != group[-1].get("created_at"):
+            yield from reversed(group)
+            group.clear()
+        group.append(doc)
+    yield from reversed(group)
+
+
+def _new_id() -> str:
+    """
+    Generate a new document ID.
+
+    Random on purpose: Firestore hotspots on monotonically increasing IDs.
+    """
+    return uuid.uuid4().hex
+
 
 class LocalStorageClient:
     """
@@ -23,18 +89,51 @@ class LocalStorageClient:
 
     This is a drop-in replacement for FirestoreClient that stores data
     in memory dictionaries. Data is lost when the application restarts.
+
+    Documents are bucketed by tenant (data[collection][tenant_id][doc_id]),
+    so lookups and queries only ever touch the calling tenant's documents.
+
+    By default get() and query() return copies that callers may mutate.
+    With immutable_reads=True they return read-only MappingProxyType views
+    of the stored documents instead, avoiding a dict copy per read; callers
+    must then not mutate results (and should dict() one if they need to),
+    and a view reflects later updates to its document.
     """
 
-    def __init__(self):
-        """Initialize in-memory storage."""
-        self.data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    def __init__(self, immutable_reads: bool = False):
+        """
+        Initialize in-memory storage.
+
+        Args:
+            immutable_reads: Return read-only views from get() and query()
+                instead of copies
+        """
+        self.immutable_reads = immutable_reads
+        self.data: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        # Owning tenant of each document, keyed [collection][doc_id]
+        self._doc_tenants: Dict[str, Dict[str, str]] = {}
+        # (collection, tenant) buckets where an update rewrote some created_at,
+        # so insertion order no longer matches creation order
+        self._reordered: set = set()
         logger.info("LocalStorageClient initialized (in-memory storage)")
 
-    def _get_collection(self, collection_name: str) -> Dict[str, Dict[str, Any]]:
-        """Get or create a collection dictionary."""
-        if collection_name not in self.data:
-            self.data[collection_name] = {}
-        return self.data[collection_name]
+    def _get_collection(self, collection_name: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get or create a collection dictionary of per-tenant buckets."""
+        return self.data.setdefault(collection_name, {})
+
+    def _get_bucket(self, collection_name: str, tenant_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get or create a tenant's documents within a collection."""
+        return self._get_collection(collection_name).setdefault(tenant_id, {})
+
+    def _find_bucket(self, collection_name: str, tenant_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get a tenant's documents for reading, without creating empty buckets."""
+        return self.data.get(collection_name, {}).get(tenant_id, {})
+
+    def _read_view(self, doc_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap a stored document for returning to a caller."""
+        if self.immutable_reads:
+            return MappingProxyType(doc_data)
+        return doc_data.copy()
 
     async def create(
         self,
@@ -53,24 +152,57 @@ class LocalStorageClient:
         Returns:
             Document ID (string)
         """
-        # Security: Ensure tenant_id is always set in the document
-        data["tenant_id"] = tenant_id
+        return self._insert(collection_name, data, tenant_id, datetime.utcnow())
 
+    def _insert(
+        self,
+        collection_name: str,
+        data: Dict[str, Any],
+        tenant_id: str,
+        now: datetime
+    ) -> str:
+        """Store a new document stamped with the given creation time."""
         # Generate document ID if not provided
-        doc_id = data.get("id") or str(uuid.uuid4())
-        if "id" not in data:
-            data["id"] = doc_id
+        doc_id = data.get("id") or _new_id()
+
+        # Security: Ensure tenant_id is always set in the document,
+        # alongside the ID and timestamps in a single write
+        data.update({"tenant_id": tenant_id, "id": doc_id, "created_at": now, "updated_at": now})
+
+        # Store in memory. Document IDs are unique per collection, so drop any
+        # previous document with this ID from its owner's bucket first
+        doc_tenants = self._doc_tenants.setdefault(collection_name, {})
+        previous_tenant = doc_tenants.get(doc_id)
+        if previous_tenant is not None and previous_tenant != tenant_id:
+            del self._get_bucket(collection_name, previous_tenant)[doc_id]
+        doc_tenants[doc_id] = tenant_id
+        # Re-insert rather than overwrite, so buckets stay in creation order
+        bucket = self._get_bucket(collection_name, tenant_id)
+        bucket.pop(doc_id, None)
+        bucket[doc_id] = data.copy()
 
-        # Add timestamps
-        now = datetime.utcnow()
-        data["created_at"] = now
-        data["updated_at"] = now
+        return doc_id
 
-        # Store in memory
-        collection = self._get_collection(collection_name)
-        collection[doc_id] = data.copy()
+    async def create_many(
+        self,
+        collection_name: str,
+        items: List[Dict[str, Any]],
+        tenant_id: str
+    ) -> List[str]:
+        """
+        Create several documents in memory.
 
-        return doc_id
+        Args:
+            collection_name: Name of the collection
+            items: Document data dictionaries
+            tenant_id: Tenant identifier
+
+        Returns:
+            Document IDs, in the order of items
+        """
+        # One timestamp for the whole batch, as a Firestore batch commit would
+        now = datetime.utcnow()
+        return [self._insert(collection_name, data, tenant_id, now) for data in items]
 
     async def get(
         self,
@@ -89,17 +221,32 @@ class LocalStorageClient:
         Returns:
             Document data as dictionary, or None if not found or unauthorized
         """
-        collection = self._get_collection(collection_name)
-        doc_data = collection.get(doc_id)
-
+        # Security: Only the tenant's own bucket is searched
+        doc_data = self._find_bucket(collection_name, tenant_id).get(doc_id)
         if doc_data is None:
             return None
 
-        # Security check: Verify tenant_id matches
-        if doc_data.get("tenant_id") != tenant_id:
-            return None
+        return self._read_view(doc_data)
 
-        return doc_data.copy()
+    async def get_many(
+        self,
+        collection_name: str,
+        doc_ids: List[str],
+        tenant_id: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several documents by ID from memory.
+
+        Args:
+            collection_name: Name of the collection
+            doc_ids: Document IDs
+            tenant_id: Tenant identifier for security verification
+
+        Returns:
+            Document dicts in the order of doc_ids, None where not found or
+            unauthorized
+        """
+        return [await self.get(collection_name, doc_id, tenant_id) for doc_id in doc_ids]
 
     async def update(
         self,
@@ -120,24 +267,60 @@ class LocalStorageClient:
         Returns:
             True if update successful, False if unauthorized or not found
         """
-        # Security: First verify the tenant has access to this document
-        existing_doc = await self.get(collection_name, doc_id, tenant_id)
-        if existing_doc is None:
+        return self._apply_update(collection_name, doc_id, updates, tenant_id, datetime.utcnow())
+
+    def _apply_update(
+        self,
+        collection_name: str,
+        doc_id: str,
+        updates: Dict[str, Any],
+        tenant_id: str,
+        now: datetime
+    ) -> bool:
+        """Update a tenant's document in place, stamping it with the given time."""
+        # Security: Only the tenant's own bucket is searched
+        doc_data = self._find_bucket(collection_name, tenant_id).get(doc_id)
+        if doc_data is None:
             return False
 
         # Add updated_at timestamp
-        updates["updated_at"] = datetime.utcnow()
+        updates["updated_at"] = now
 
         # Ensure tenant_id cannot be changed (security)
         if "tenant_id" in updates:
             del updates["tenant_id"]
 
+        if "created_at" in updates and updates["created_at"] != doc_data.get("created_at"):
+            self._reordered.add((collection_name, tenant_id))
+
         # Update in memory
-        collection = self._get_collection(collection_name)
-        collection[doc_id].update(updates)
+        doc_data.update(updates)
 
         return True
 
+    async def update_many(
+        self,
+        collection_name: str,
+        updates_by_id: Dict[str, Dict[str, Any]],
+        tenant_id: str
+    ) -> List[bool]:
+        """
+        Update several documents in memory.
+
+        Args:
+            collection_name: Name of the collection
+            updates_by_id: Mapping of document ID to fields to update
+            tenant_id: Tenant identifier for access verification
+
+        Returns:
+            update() results, in the order of updates_by_id
+        """
+        now = datetime.utcnow()
+        return [
+            self._apply_update(collection_name, doc_id, updates, tenant_id, now)
+            for doc_id, updates in updates_by_id.items()
+        ]
+
     async def delete(
         self,
         collection_name: str,
@@ -155,14 +338,14 @@ class LocalStorageClient:
         Returns:
             True if delete successful, False if unauthorized or not found
         """
-        # Security: First verify the tenant has access to this document
-        existing_doc = await self.get(collection_name, doc_id, tenant_id)
-        if existing_doc is None:
+        # Security: Only the tenant's own bucket is searched
+        bucket = self._find_bucket(collection_name, tenant_id)
+        if doc_id not in bucket:
             return False
 
         # Delete from memory
-        collection = self._get_collection(collection_name)
-        del collection[doc_id]
+        del bucket[doc_id]
+        del self._doc_tenants[collection_name][doc_id]
 
         return True
 
@@ -187,43 +370,55 @@ class LocalStorageClient:
         Returns:
             List of document dictionaries
         """
-        collection = self._get_collection(collection_name)
-
-        # Filter by tenant_id first (security)
+        # Security: Only the tenant's own bucket is read
+        bucket = self._find_bucket(collection_name, tenant_id)
+
+        # Buckets hold documents in creation order, so unfiltered queries in
+        # that order are served straight off the ends without scanning/sorting,
+        # unless an update has moved some document's created_at
+        if not filters and (
+            order_by is None
+            or (order_by in ("created_at", "-created_at")
+                and (collection_name, tenant_id) not in self._reordered)
+        ):
+            docs = _newest_first(bucket.values()) if order_by == "-created_at" else bucket.values()
+            if limit:
+                docs = islice(docs, limit)
+            return [self._read_view(doc) for doc in docs]
+
+        # Resolve operators once per call rather than once per document
+        equality = []
+        ranges = []
+        for field, op, value in filters or []:
+            if op in _OPS:
+                target = equality if op in _EQUALITY_OPS else ranges
+                target.append((field, _OPS[op], value))
+
+        # Single pass; documents are copied only once they've survived filtering
         results = [
-            doc.copy() for doc in collection.values()
-            if doc.get("tenant_id") == tenant_id
+            doc for doc in bucket.values()
+            if all(cmp(doc.get(f), v) for f, cmp, v in equality)
+            and all((x := doc.get(f)) is not None and cmp(x, v) for f, cmp, v in ranges)
         ]
 
-        # Apply additional filters
-        if filters:
-            for field, operator, value in filters:
-                if operator == "==":
-                    results = [d for d in results if d.get(field) == value]
-                elif operator == "!=":
-                    results = [d for d in results if d.get(field) != value]
-                elif operator == "<":
-                    results = [d for d in results if d.get(field) is not None and d.get(field) < value]
-                elif operator == "<=":
-                    results = [d for d in results if d.get(field) is not None and d.get(field) <= value]
-                elif operator == ">":
-                    results = [d for d in results if d.get(field) is not None and d.get(field) > value]
-                elif operator == ">=":
-                    results = [d for d in results if d.get(field) is not None and d.get(field) >= value]
-
         # Apply ordering
         if order_by:
             reverse = False
             if order_by.startswith("-"):
                 reverse = True
                 order_by = order_by[1:]
-            results.sort(key=lambda x: x.get(order_by, ""), reverse=reverse)
+            # itemgetter keeps key extraction in C; fall back to a default
+            # of "" only if some document is missing the field
+            try:
+                results.sort(key=operator.itemgetter(order_by), reverse=reverse)
+            except KeyError:
+                results.sort(key=lambda x, f=order_by: x.get(f, ""), reverse=reverse)
 
         # Apply limit
         if limit:
             results = results[:limit]
 
-        return results
+        return [self._read_view(doc) for doc in results]
 
 
 class FirestoreClient:
@@ -241,17 +436,41 @@ class FirestoreClient:
             project_id: Google Cloud project ID or "local-dev" for local storage
         """
         self.project_id = project_id
-        self._use_local = project_id == "local-dev" or not GOOGLE_CLOUD_AVAILABLE
+        self._use_local = project_id == "local-dev"
+
+        # Google Cloud libraries are imported only when actually needed, so
+        # local development doesn't pay for loading gRPC/protobuf (and can
+        # run without them installed)
+        if not self._use_local:
+            try:
+                from google.api_core.exceptions import FailedPrecondition, NotFound
+                from google.cloud import firestore
+            except ImportError:
+                logger.warning("Google Cloud libraries not installed. Using local storage.")
+                self._use_local = True
+            else:
+                self._firestore = firestore
+                # Raised when a precondition-guarded write finds the document changed or gone
+                self._stale_write_errors = (FailedPrecondition, NotFound)
 
         if self._use_local:
             self._local_client = LocalStorageClient()
-            if not GOOGLE_CLOUD_AVAILABLE:
-                logger.warning("Google Cloud libraries not installed. Using local storage.")
-            else:
+            if project_id == "local-dev":
                 logger.info("Using local in-memory storage (project_id='local-dev')")
         else:
-            self.db = firestore.Client(project=project_id)
-            logger.info(f"Connected to Firestore project: {project_id}")
+            # Created on first use by the db property
+            self._db = None
+            # Dedicated pool so Firestore calls don't contend with FastAPI's
+            # default executor (used for sync route handlers)
+            self._executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("FIRESTORE_POOL_SIZE", "32")),
+                thread_name_prefix="firestore"
+            )
+            # LRU of tenant-scoped base queries keyed by (collection_name, tenant_id)
+            self._base_queries: OrderedDict = OrderedDict()
+            # LRU of (collection_name, doc_id) -> (tenant_id, update_time, expires_at)
+            self._owner_cache: OrderedDict = OrderedDict()
+            logger.info(f"Using Firestore project: {project_id}")
 
         self.collections = {
             "liens": "liens",
@@ -265,15 +484,131 @@ class FirestoreClient:
             "sms_queue": "sms_queue"
         }
 
+    @property
+    def db(self):
+        """Firestore client, created on first use."""
+        if self._db is None:
+            self._db = self._firestore.Client(project=self.project_id)
+        return self._db
+
+    async def aclose(self) -> None:
+        """Shut down the Firestore executor and client. No-op for local storage."""
+        if self._use_local:
+            return
+
+        await asyncio.to_thread(self._executor.shutdown)
+        if self._db is not None:
+            self._db.close()
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking Firestore call on the dedicated executor."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
     def _sanitize_data(self, data: Any) -> Any:
-        """Recursively convert Decimal to float for Firestore compatibility."""
+        """
+        Convert Decimal to float (at any depth) for Firestore compatibility.
+
+        Data without any Decimal is returned as-is. Otherwise a converted copy
+        is built, walking nested dicts/lists with an explicit stack.
+        """
         if isinstance(data, Decimal):
             return float(data)
-        if isinstance(data, dict):
-            return {k: self._sanitize_data(v) for k, v in data.items()}
-        if isinstance(data, list):
-            return [self._sanitize_data(i) for i in data]
-        return data
+        if not _contains_decimal(data):
+            return data
+
+        root = dict(data) if isinstance(data, dict) else list(data)
+        stack = [root]
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, Decimal):
+                    container[key] = float(value)
+                elif isinstance(value, dict):
+                    container[key] = dict(value)
+                    stack.append(container[key])
+                elif isinstance(value, list):
+                    container[key] = list(value)
+                    stack.append(container[key])
+        return root
+
+    def _prepare_create(self, data: Dict[str, Any], tenant_id: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Stamp a new document with its ID, tenant and timestamps.
+
+        Returns:
+            (document ID, payload to write)
+        """
+        # Generate document ID if not provided
+        doc_id = data.get("id") or _new_id()
+
+        # Security: Ensure tenant_id is always set in the document,
+        # alongside the ID and timestamps in a single write
+        now = datetime.utcnow()
+        data.update({"tenant_id": tenant_id, "id": doc_id, "created_at": now, "updated_at": now})
+
+        # The stored timestamps are filled in server-side to avoid client clock
+        # skew. The sentinel only goes into the payload: callers often return
+        # data as-is, and it can't be serialized into a response
+        ts = self._firestore.SERVER_TIMESTAMP
+        return doc_id, {**self._sanitize_data(data), "created_at": ts, "updated_at": ts}
+
+    def _prepare_update(self, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Stamp updated_at and strip tenant_id from an update; return the payload to write."""
+        # Add updated_at timestamp
+        updates["updated_at"] = datetime.utcnow()
+
+        # Ensure tenant_id cannot be changed (security)
+        if "tenant_id" in updates:
+            del updates["tenant_id"]
+
+        # Stored value is set server-side; see _prepare_create
+        return {**self._sanitize_data(updates), "updated_at": self._firestore.SERVER_TIMESTAMP}
+
+    def _remember_owner(self, collection_name: str, doc_id: str, tenant_id: str, update_time: Any) -> None:
+        """Cache a document's owner and the update_time it was seen at."""
+        key = (collection_name, doc_id)
+        self._owner_cache[key] = (tenant_id, update_time, time.monotonic() + OWNER_CACHE_TTL_SECONDS)
+        self._owner_cache.move_to_end(key)
+        if len(self._owner_cache) > OWNER_CACHE_SIZE:
+            self._owner_cache.popitem(last=False)
+
+    def _cached_update_time(self, collection_name: str, doc_id: str, tenant_id: str) -> Any:
+        """
+        Get the update_time a document was last seen at, if it was recently
+        seen owned by tenant_id. Returns None otherwise.
+        """
+        key = (collection_name, doc_id)
+        entry = self._owner_cache.get(key)
+        if entry is None:
+            return None
+
+        owner, update_time, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._owner_cache[key]
+            return None
+        return update_time if owner == tenant_id else None
+
+    def _tenant_query(self, collection_name: str, tenant_id: str):
+        """
+        Get the base query for a collection, scoped to a tenant.
+
+        Firestore queries are immutable, so the tenant filter is built once
+        per (collection, tenant) and reused as the starting point for later
+        where/order_by/limit calls.
+        """
+        key = (collection_name, tenant_id)
+        base = self._base_queries.get(key)
+        if base is not None:
+            self._base_queries.move_to_end(key)
+            return base
+
+        collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
+        base = collection_ref.where("tenant_id", "==", tenant_id)
+        self._base_queries[key] = base
+        if len(self._base_queries) > BASE_QUERY_CACHE_SIZE:
+            self._base_queries.popitem(last=False)
+        return base
 
     async def create(
         self,
@@ -299,30 +634,54 @@ class FirestoreClient:
         if self._use_local:
             return await self._local_client.create(collection_name, data, tenant_id)
 
-        # Security: Ensure tenant_id is always set in the document
-        data["tenant_id"] = tenant_id
-
-        # Generate document ID if not provided
-        doc_id = data.get("id") or str(uuid.uuid4())
-        if "id" not in data:
-            data["id"] = doc_id
+        doc_id, payload = self._prepare_create(data, tenant_id)
 
-        # Add timestamps
-        now = datetime.utcnow()
-        data["created_at"] = now
-        data["updated_at"] = now
-        
         # Get collection reference
         collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
 
         # Create document (run in thread pool since Firestore client is synchronous)
-        loop = asyncio.get_event_loop()
         doc_ref = collection_ref.document(doc_id)
-        data = self._sanitize_data(data)
-        await loop.run_in_executor(None, doc_ref.set, data)
+        await self._run(doc_ref.set, payload)
 
         return doc_id
 
+    async def create_many(
+        self,
+        collection_name: str,
+        items: List[Dict[str, Any]],
+        tenant_id: str
+    ) -> List[str]:
+        """
+        Create several documents with batched writes.
+
+        Each document is prepared exactly as in create(), then written in
+        WriteBatch commits of up to FIRESTORE_BATCH_LIMIT documents, so a bulk
+        import costs one round-trip per batch instead of one per document.
+
+        Args:
+            collection_name: Name of the collection
+            items: Document data dictionaries
+            tenant_id: Tenant identifier (will be enforced in each document)
+
+        Returns:
+            Document IDs, in the order of items
+        """
+        if self._use_local:
+            return await self._local_client.create_many(collection_name, items, tenant_id)
+
+        collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
+
+        doc_ids = []
+        for start in range(0, len(items), FIRESTORE_BATCH_LIMIT):
+            batch = self.db.batch()
+            for data in items[start:start + FIRESTORE_BATCH_LIMIT]:
+                doc_id, payload = self._prepare_create(data, tenant_id)
+                batch.set(collection_ref.document(doc_id), payload)
+                doc_ids.append(doc_id)
+            await self._run(batch.commit)
+
+        return doc_ids
+
     async def get(
         self,
         collection_name: str,
@@ -350,9 +709,8 @@ class FirestoreClient:
         collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
 
         # Fetch document (run in thread pool since Firestore client is synchronous)
-        loop = asyncio.get_event_loop()
         doc_ref = collection_ref.document(doc_id)
-        doc = await loop.run_in_executor(None, doc_ref.get)
+        doc = await self._run(doc_ref.get)
 
         # Check if document exists
         if not doc.exists:
@@ -362,11 +720,58 @@ class FirestoreClient:
         # This prevents tenants from accessing other tenants' data
         doc_data = doc.to_dict()
         stored_tenant = doc_data.get("tenant_id")
+        self._remember_owner(collection_name, doc_id, stored_tenant, doc.update_time)
         if stored_tenant != tenant_id:
             return None
 
         return doc_data
 
+    async def get_many(
+        self,
+        collection_name: str,
+        doc_ids: List[str],
+        tenant_id: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several documents by ID in a single batched read.
+
+        Applies the same tenant check as get() to every document.
+
+        Args:
+            collection_name: Name of the collection
+            doc_ids: Document IDs
+            tenant_id: Tenant identifier for security verification
+
+        Returns:
+            Document dicts in the order of doc_ids, None where not found or
+            unauthorized
+        """
+        if self._use_local:
+            return await self._local_client.get_many(collection_name, doc_ids, tenant_id)
+
+        if not doc_ids:
+            return []
+
+        # Each distinct document is fetched once, however often it's asked for
+        collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
+        doc_refs = [collection_ref.document(doc_id) for doc_id in dict.fromkeys(doc_ids)]
+
+        # One BatchGetDocuments RPC; results may come back in any order
+        snapshots = await self._run(lambda: list(self.db.get_all(doc_refs)))
+
+        found = {}
+        for doc in snapshots:
+            if not doc.exists:
+                continue
+            doc_data = doc.to_dict()
+            stored_tenant = doc_data.get("tenant_id")
+            self._remember_owner(collection_name, doc.id, stored_tenant, doc.update_time)
+            # Security check: Verify tenant_id matches
+            if stored_tenant == tenant_id:
+                found[doc.id] = doc_data
+
+        return [found.get(doc_id) for doc_id in doc_ids]
+
     async def update(
         self,
         collection_name: str,
@@ -377,7 +782,9 @@ class FirestoreClient:
         """
         Update a document.
 
-        First call get() to verify tenant has access.
+        First call get() to verify tenant has access, unless a recent get()
+        already confirmed it; then the read is skipped and the write is made
+        conditional on the document being unchanged since that get().
         Automatically add updated_at timestamp.
         Return True if successful, False if unauthorized/not found.
 
@@ -393,28 +800,115 @@ class FirestoreClient:
         if self._use_local:
             return await self._local_client.update(collection_name, doc_id, updates, tenant_id)
 
+        # Get collection reference
+        collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
+        doc_ref = collection_ref.document(doc_id)
+
+        # Fast path: ownership was confirmed by a recent get(). Skip the read and
+        # require the document to be unchanged since then, which also rules out
+        # it having been replaced by another tenant's document
+        update_time = self._cached_update_time(collection_name, doc_id, tenant_id)
+        if update_time is not None:
+            payload = self._prepare_update(updates)
+            option = self.db.write_option(last_update_time=update_time)
+            try:
+                result = await self._run(partial(doc_ref.update, payload, option=option))
+            except self._stale_write_errors:
+                self._owner_cache.pop((collection_name, doc_id), None)
+            else:
+                self._remember_owner(collection_name, doc_id, tenant_id, result.update_time)
+                return True
+
         # Security: First verify the tenant has access to this document
         existing_doc = await self.get(collection_name, doc_id, tenant_id)
         if existing_doc is None:
             return False
 
-        # Add updated_at timestamp
-        updates["updated_at"] = datetime.utcnow()
+        payload = self._prepare_update(updates)
 
-        # Ensure tenant_id cannot be changed (security)
-        if "tenant_id" in updates:
-            del updates["tenant_id"]
+        # Update document (run in thread pool since Firestore client is synchronous)
+        result = await self._run(doc_ref.update, payload)
+        self._remember_owner(collection_name, doc_id, tenant_id, result.update_time)
+
+        return True
+
+    async def update_many(
+        self,
+        collection_name: str,
+        updates_by_id: Dict[str, Dict[str, Any]],
+        tenant_id: str
+    ) -> List[bool]:
+        """
+        Update several documents with batched writes.
+
+        Tenant access is verified for every document (in one batched read)
+        before any write; only authorized updates are committed, in WriteBatch
+        commits of up to FIRESTORE_BATCH_LIMIT documents.
+
+        Args:
+            collection_name: Name of the collection
+            updates_by_id: Mapping of document ID to fields to update
+            tenant_id: Tenant identifier for access verification
+
+        Returns:
+            Per-document results (False if unauthorized/not found), in the
+            order of updates_by_id
+        """
+        if self._use_local:
+            return await self._local_client.update_many(collection_name, updates_by_id, tenant_id)
+
+        # Security: First verify the tenant has access to every document
+        existing_docs = await self.get_many(collection_name, list(updates_by_id), tenant_id)
+        results = [doc is not None for doc in existing_docs]
+        authorized = [
+            (doc_id, updates)
+            for (doc_id, updates), allowed in zip(updates_by_id.items(), results)
+            if allowed
+        ]
 
-        # Get collection reference
         collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
 
-        # Update document (run in thread pool since Firestore client is synchronous)
-        loop = asyncio.get_event_loop()
-        doc_ref = collection_ref.document(doc_id)
-        updates = self._sanitize_data(updates)
-        await loop.run_in_executor(None, doc_ref.update, updates)
+        for start in range(0, len(authorized), FIRESTORE_BATCH_LIMIT):
+            chunk = authorized[start:start + FIRESTORE_BATCH_LIMIT]
+            batch = self.db.batch()
+            for doc_id, updates in chunk:
+                batch.update(collection_ref.document(doc_id), self._prepare_update(updates))
+            write_results = await self._run(batch.commit)
+            # Keep the fast path in update() valid for the documents just written
+            for (doc_id, _), result in zip(chunk, write_results):
+                self._remember_owner(collection_name, doc_id, tenant_id, result.update_time)
 
-        return True
+        return results
+
+    async def bulk_update(
+        self,
+        collection_name: str,
+        updates_by_id: Dict[str, Dict[str, Any]],
+        tenant_id: str
+    ) -> List[bool]:
+        """
+        Update many documents concurrently.
+
+        Each update goes through update() (so the tenant check still applies),
+        with at most BULK_CONCURRENCY requests in flight at once.
+
+        Args:
+            collection_name: Name of the collection
+            updates_by_id: Mapping of document ID to fields to update
+            tenant_id: Tenant identifier for access verification
+
+        Returns:
+            List of update() results, in the order of updates_by_id
+        """
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def _update_one(doc_id: str, updates: Dict[str, Any]) -> bool:
+            async with semaphore:
+                return await self.update(collection_name, doc_id, updates, tenant_id)
+
+        return await asyncio.gather(
+            *(_update_one(doc_id, updates) for doc_id, updates in updates_by_id.items())
+        )
 
     async def delete(
         self,
@@ -439,18 +933,30 @@ class FirestoreClient:
         if self._use_local:
             return await self._local_client.delete(collection_name, doc_id, tenant_id)
 
+        # Get collection reference
+        collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
+        doc_ref = collection_ref.document(doc_id)
+
+        # Fast path: same conditional write as update()
+        update_time = self._cached_update_time(collection_name, doc_id, tenant_id)
+        self._owner_cache.pop((collection_name, doc_id), None)
+        if update_time is not None:
+            option = self.db.write_option(last_update_time=update_time)
+            try:
+                await self._run(partial(doc_ref.delete, option=option))
+            except self._stale_write_errors:
+                pass
+            else:
+                return True
+
         # Security: First verify the tenant has access to this document
         existing_doc = await self.get(collection_name, doc_id, tenant_id)
         if existing_doc is None:
             return False
 
-        # Get collection reference
-        collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
-
         # Delete document (run in thread pool since Firestore client is synchronous)
-        loop = asyncio.get_event_loop()
-        doc_ref = collection_ref.document(doc_id)
-        await loop.run_in_executor(None, doc_ref.delete)
+        await self._run(doc_ref.delete)
+        self._owner_cache.pop((collection_name, doc_id), None)
 
         return True
 
@@ -469,6 +975,10 @@ class FirestoreClient:
         filters is list of (field, operator, value) tuples.
         Return list of document dicts.
 
+        Equality filters are applied before range filters, matching the
+        field order of Firestore composite indexes. Ordered queries need a
+        composite index on (tenant_id, <order_by>) in each collection.
+
         Args:
             collection_name: Name of the collection
             tenant_id: Tenant identifier (required for security)
@@ -482,17 +992,14 @@ class FirestoreClient:
         if self._use_local:
             return await self._local_client.query(collection_name, tenant_id, filters, order_by, limit)
 
-        # Get collection reference
-        collection_ref = self.db.collection(self.collections.get(collection_name, collection_name))
-
         # Security: ALWAYS filter by tenant_id first
         # This ensures tenants can only query their own data
-        query = collection_ref.where("tenant_id", "==", tenant_id)
+        query = self._tenant_query(collection_name, tenant_id)
 
-        # Apply additional filters
+        # Apply additional filters, equality filters first (stable sort)
         if filters:
-            for field, operator, value in filters:
-                query = query.where(field, operator, value)
+            for field, op, value in sorted(filters, key=lambda f: f[1] != "=="):
+                query = query.where(field, op, value)
 
         # Apply ordering
         if order_by:
@@ -503,8 +1010,25 @@ class FirestoreClient:
             query = query.limit(limit)
 
         # Execute query (run in thread pool since Firestore client is synchronous)
-        loop = asyncio.get_event_loop()
-        docs = await loop.run_in_executor(None, query.get)
+        docs = await self._run(query.get)
 
         # Convert to list of dictionaries
         return [doc.to_dict() for doc in docs]
+
+
+@lru_cache(maxsize=8)
+def get_firestore_client(project_id: str = "local-dev") -> FirestoreClient:
+    """
+    Get the shared FirestoreClient for a project.
+
+    Creating a client sets up auth and a gRPC channel, so callers that may
+    ask repeatedly (scripts, tooling) should reuse one per project. Note
+    that the shared "local-dev" client also shares its in-memory data.
+
+    Args:
+        project_id: Google Cloud project ID or "local-dev" for local storage
+
+    Returns:
+        FirestoreClient instance, created on first call for each project_id
+    """
+    return FirestoreClient(project_id=project_id)
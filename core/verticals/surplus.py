@@ -1,6 +1,5 @@
-from decimal import Decimal
 from datetime import date
-from typing import Optional
+from typing import ClassVar, Optional, Tuple
 
 from pydantic import Field, field_serializer
 
@@ -10,17 +9,17 @@ class SurplusFund(Asset):
     """Surplus fund model."""
     asset_type: AssetType = Field(default=AssetType.SURPLUS_FUND, description="Type of asset")
     foreclosure_date: date = Field(..., description="Date of foreclosure sale")
-    winning_bid_amount: Decimal = Field(..., description="Amount of the winning bid")
-    total_debt_owed: Decimal = Field(..., description="Total debt owed at time of sale")
-    surplus_amount: Decimal = Field(..., description="Calculated surplus amount")
+    winning_bid_amount: float = Field(..., description="Amount of the winning bid")
+    total_debt_owed: float = Field(..., description="Total debt owed at time of sale")
+    surplus_amount: float = Field(..., description="Calculated surplus amount")
     claim_deadline: date = Field(..., description="Deadline to file a claim")
 
-    @field_serializer('foreclosure_date', 'claim_deadline')
-    def serialize_date(self, value: date, _info) -> str:
+    # Serialized as ISO format strings
+    _DATE_FIELDS: ClassVar[Tuple[str, ...]] = ("foreclosure_date", "claim_deadline")
+
+    @field_serializer(*_DATE_FIELDS)
+    def serialize_date(self, value: Optional[date], _info) -> Optional[str]:
         """Serialize date to ISO format string."""
+        if value is None:
+            return None
         return value.isoformat()
-
-    @field_serializer('winning_bid_amount', 'total_debt_owed', 'surplus_amount')
-    def serialize_decimal(self, value: Decimal, _info) -> float:
-        """Serialize Decimal to float."""
-        return float(value)
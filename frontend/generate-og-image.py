@@ -7,6 +7,7 @@ Run with: python3 generate-og-image.py
 try:
     from PIL import Image, ImageDraw, ImageFont
     import os
+    from functools import lru_cache
 except ImportError:
     print("\n⚠️  PIL/Pillow not installed.")
     print("\nInstall with: pip3 install Pillow")
@@ -15,18 +16,20 @@ except ImportError:
     print("and click 'Download OG Image', then move to public/og-image.png\n")
     exit(0)
 
-# Create image
+# Create image with gradient background (approximated).
+# Build a 1px-wide column of row colors and stretch it to full width in one
+# C-level resize, instead of drawing one line per row.
 width, height = 1200, 630
-img = Image.new('RGB', (width, height), color='#0f172a')
-draw = ImageDraw.Draw(img)
-
-# Draw gradient background (approximated)
+column = bytearray()
 for y in range(height):
     ratio = y / height
-    r = int(15 + (30 - 15) * ratio)
-    g = int(23 + (41 - 23) * ratio)
-    b = int(42 + (59 - 42) * ratio)
-    draw.line([(0, y), (width, y)], fill=(r, g, b))
+    column += bytes((
+        int(15 + (30 - 15) * ratio),
+        int(23 + (41 - 23) * ratio),
+        int(42 + (59 - 42) * ratio),
+    ))
+img = Image.frombytes('RGB', (1, height), bytes(column)).resize((width, height), Image.NEAREST)
+draw = ImageDraw.Draw(img)
 
 # Draw main container
 draw.rectangle([80, 80, 1120, 550], fill='#1e293b', outline='#475569', width=2)
@@ -34,13 +37,19 @@ draw.rectangle([80, 80, 1120, 550], fill='#1e293b', outline='#475569', width=2)
 # Draw logo box
 draw.rectangle([120, 120, 200, 200], fill='#3b82f6')
 
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a TrueType font once per (path, size)."""
+    return ImageFont.truetype(path, size)
+
+
 # Try to load fonts (fallback to default if not available)
 try:
-    font_large = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial Bold.ttf", 80)
-    font_medium = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", 36)
-    font_small = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", 24)
-    font_tiny = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", 16)
-    font_logo = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial Bold.ttf", 60)
+    font_large = load_font("/System/Library/Fonts/Supplemental/Arial Bold.ttf", 80)
+    font_medium = load_font("/System/Library/Fonts/Supplemental/Arial.ttf", 36)
+    font_small = load_font("/System/Library/Fonts/Supplemental/Arial.ttf", 24)
+    font_tiny = load_font("/System/Library/Fonts/Supplemental/Arial.ttf", 16)
+    font_logo = load_font("/System/Library/Fonts/Supplemental/Arial Bold.ttf", 60)
 except:
     print("⚠️  Using default font (system fonts not found)")
     font_large = ImageFont.load_default()
@@ -78,7 +87,13 @@ box_width = 130
 box_height = 50
 gap = 15
 
-for i, agent in enumerate(agents):
+# Measure every label once, up front, as its offset within a box
+text_offsets = []
+for agent in agents:
+    text_bbox = draw.textbbox((0, 0), agent, font=font_tiny)
+    text_offsets.append((box_width - (text_bbox[2] - text_bbox[0])) / 2)
+
+for i, (agent, text_offset) in enumerate(zip(agents, text_offsets)):
     x = start_x + (i * (box_width + gap))
 
     # Draw box
@@ -86,10 +101,7 @@ for i, agent in enumerate(agents):
                    fill='#334155', outline='#475569', width=1)
 
     # Draw text (centered)
-    text_bbox = draw.textbbox((0, 0), agent, font=font_tiny)
-    text_width = text_bbox[2] - text_bbox[0]
-    text_x = x + (box_width - text_width) / 2
-    draw.text((text_x, start_y + 18), agent, fill='#e2e8f0', font=font_tiny)
+    draw.text((x + text_offset, start_y + 18), agent, fill='#e2e8f0', font=font_tiny)
 
 # Draw bottom tagline
 draw.text((120, 480), 'Automate operations • Track portfolios • Maximize returns',
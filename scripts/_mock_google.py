@@ -0,0 +1,54 @@
+"""
+Stand-ins for optional Google packages used by the loader scripts.
+
+The loaders only need the agents' data logic, not ADK or Gemini, so when
+google.adk / google.genai aren't installed they're replaced with mocks.
+Set SKIP_ADK_STUBS=1 (or true/yes) to bypass this entirely when the full deps
+are present.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+_DONE = False
+
+
+class _StubAgent:
+    """Replacement for google.adk.agents.Agent, which base classes subclass."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def _install(package: str, submodules: tuple) -> MagicMock:
+    """Register one mock for package and its submodules (as child attributes)."""
+    stub = MagicMock()
+    sys.modules[package] = stub
+    for name in submodules:
+        module = stub
+        for part in name.split("."):
+            module = getattr(module, part)
+        sys.modules[f"{package}.{name}"] = module
+    return stub
+
+
+def ensure_google_stubs() -> None:
+    """Mock out google.adk and google.genai if they can't be imported. Idempotent."""
+    global _DONE
+    if _DONE or os.getenv("SKIP_ADK_STUBS", "").lower() in {"1", "true", "yes"}:
+        return
+    _DONE = True
+
+    if "google.adk" not in sys.modules:
+        try:
+            import google.adk  # noqa: F401
+        except ImportError:
+            adk = _install("google.adk", ("agents", "types", "apps", "apps.app"))
+            adk.agents.Agent = _StubAgent
+
+    if "google.genai" not in sys.modules:
+        try:
+            import google.genai  # noqa: F401
+        except ImportError:
+            _install("google.genai", ("types",))
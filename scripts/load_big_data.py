@@ -4,8 +4,6 @@ import asyncio
 import random
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock
-import types
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -14,7 +12,6 @@ load_dotenv()
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Mock Google packages if missing (Copied from load_universal_data.py for stability)
 # Handle Google Cloud imports
 try:
     import google.auth
@@ -26,48 +23,52 @@ except ImportError:
     sys.exit(1)
 
 # Handle ADK imports (Mock if missing, as we only need Agents logic)
-try:
-    import google.adk
-except ImportError:
-    # Check if google.adk is already in sys.modules (partial install)
-    if "google.adk" not in sys.modules:
-        adk = MagicMock()
-        sys.modules["google.adk"] = adk
-        if hasattr(google, 'adk'):
-             google.adk = adk
-        
-        sys.modules["google.adk.agents"] = MagicMock()
-        sys.modules["google.adk.types"] = MagicMock()
-        sys.modules["google.adk.apps"] = MagicMock()
-        sys.modules["google.adk.apps.app"] = MagicMock()
-        
-        # Mock Agent class specifically if needed by base classes
-        class MockAgent:
-            def __init__(self, *args, **kwargs): pass
-        sys.modules["google.adk.agents"].Agent = MockAgent
+from scripts._mock_google import ensure_google_stubs
+ensure_google_stubs()
 
 # Import your agents (The "Engines")
-from core.storage import FirestoreClient
+from core.storage import get_firestore_client
 try:
     from agents.lien_tracker.agent import LienTrackerAgent
     from agents.judgment_tracker.agent import JudgmentTrackerAgent
     from agents.mineral_tracker.agent import MineralTrackerAgent
     from agents.probate_tracker.agent import ProbateTrackerAgent
     from agents.surplus_tracker.agent import SurplusTrackerAgent
+    from agents.deadline_alert.agent import DeadlineAlertAgent
 except ImportError as e:
     print(f"Error importing agents: {e}")
     sys.exit(1)
 
+# Set SEED to a non-zero integer for reproducible data
+rng = random.Random(int(os.getenv("SEED", "0")) or None)
+
 # Constants for "Big Data"
 TENANT_ID = "demo-user"
 COUNTIES = ["Miami-Dade", "Cook", "Harris", "Maricopa", "San Bernardino", "Clark", "Fulton", "Bexar"]
 NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez"]
 COMPANIES = ["Energy Inc", "Permian Resources", "Eagle Ford Ops", "Bakken Drillers", "GeoWest"]
 
+# Agent calls awaited together per gather
+WRITE_CHUNK_SIZE = 40
+
 class SimpleContext:
     def __init__(self, parameters):
-        self.parameters = parameters
+        # Own copy, so callers can't mutate it out from under a pending call
+        self.parameters = dict(parameters)
+        self.tenant_id = parameters.get("tenant_id")
+
+    def load(self, parameters):
+        """Reuse this context for another record's parameters."""
+        self.parameters.clear()
+        self.parameters.update(parameters)
         self.tenant_id = parameters.get("tenant_id")
+        return self
+
+def to_document(asset):
+    """Storage document for an asset model, keyed by its asset_id."""
+    doc = asset.model_dump()
+    doc["id"] = asset.asset_id
+    return doc
 
 async def generate_bulk_data():
     project_id = os.getenv("GOOGLE_CLOUD_PROJECT_ID") or os.getenv("GOOGLE_PROJECT_ID")
@@ -79,7 +80,7 @@ async def generate_bulk_data():
     print(f"🔌 Connecting to Firestore Project: {project_id}")
     
     # Initialize Storage with real Project ID
-    storage = FirestoreClient(project_id=project_id) 
+    storage = get_firestore_client(project_id)
     
     agents = {
         "tax_lien": LienTrackerAgent(storage),
@@ -88,79 +89,142 @@ async def generate_bulk_data():
         "probate": ProbateTrackerAgent(storage),
         "surplus_funds": SurplusTrackerAgent(storage)
     }
+    deadline_agent = DeadlineAlertAgent(storage)
+
+    # The _build_* calls are synchronous, so one context can be reused for every record
+    ctx = SimpleContext({"tenant_id": TENANT_ID})
+
+    # The agents' default IDs are second-resolution timestamps, so records
+    # built in the same second would share an ID and overwrite each other;
+    # every record gets an explicit per-vertical ID instead.
+    # Build every record up front, then write each vertical with create_many,
+    # which commits in batches instead of one round-trip per document
 
     # 1. Generate 50 Tax Liens
     print("   ... Generating 50 Tax Liens")
-    for i in range(50):
-        await agents["tax_lien"]._create_lien(SimpleContext({
+    # Draw each field's values for every lien in one call
+    n = 50
+    lien_fields = zip(
+        rng.choices(range(1000, 25001), k=n),       # purchase_amount
+        rng.choices([8, 12, 18, 24], k=n),          # interest_rate
+        rng.choices(range(30, 701), k=n),           # sale date, days ago
+        rng.choices(range(10, 366), k=n),           # redemption deadline, days ahead
+        rng.choices(COUNTIES, k=n),
+        rng.choices(range(100, 10000), k=n),        # street number
+        rng.choices(NAMES, k=n),                    # street name
+        rng.choices(range(10000, 100000), k=n),     # parcel number
+    )
+    liens = [
+        agents["tax_lien"]._build_lien(ctx.load({
             "tenant_id": TENANT_ID,
+            "lien_id": f"lien-{i:04d}",
             "certificate_number": f"TL-{2024000 + i}",
-            "purchase_amount": random.randint(1000, 25000),
-            "interest_rate": random.choice([8, 12, 18, 24]),
-            "sale_date": (datetime.now() - timedelta(days=random.randint(30, 700))).date().isoformat(),
-            "redemption_deadline": (datetime.now() + timedelta(days=random.randint(10, 365))).date().isoformat(),
-            "county": random.choice(COUNTIES),
-            "property_address": f"{random.randint(100, 9999)} {random.choice(NAMES)} St",
-            "parcel_id": f"P-{random.randint(10000, 99999)}",
+            "purchase_amount": amount,
+            "interest_rate": rate,
+            "sale_date": (datetime.now() - timedelta(days=sale_days)).date().isoformat(),
+            "redemption_deadline": (datetime.now() + timedelta(days=redemption_days)).date().isoformat(),
+            "county": county,
+            "property_address": f"{street_number} {street_name} St",
+            "parcel_id": f"P-{parcel}",
             "status": "ACTIVE"
         }))
+        for i, (amount, rate, sale_days, redemption_days, county, street_number, street_name, parcel)
+        in enumerate(lien_fields)
+    ]
 
     # 2. Generate 50 Civil Judgments
     print("   ... Generating 50 Civil Judgments")
-    for i in range(50):
-        await agents["civil_judgment"]._create_judgment(SimpleContext({
+    judgments = [
+        agents["civil_judgment"]._build_judgment(ctx.load({
             "tenant_id": TENANT_ID,
-            "case_number": f"CV-{2023}-{random.randint(1000, 9999)}",
-            "defendant_name": f"{random.choice(NAMES)} Construction LLC",
-            "judgment_amount": random.randint(5000, 150000),
-            "judgment_date": (datetime.now() - timedelta(days=random.randint(100, 1500))).date().isoformat(),
+            "asset_id": f"judgment-{i:04d}",
+            "case_number": f"CV-{2023}-{rng.randint(1000, 9999)}",
+            "defendant_name": f"{rng.choice(NAMES)} Construction LLC",
+            "judgment_amount": rng.randint(5000, 150000),
+            "judgment_date": (datetime.now() - timedelta(days=rng.randint(100, 1500))).date().isoformat(),
             "interest_rate": 10.0,
-            "court_name": f"{random.choice(COUNTIES)} Superior Court",
-            "county": random.choice(COUNTIES),
-            "status": random.choice(["ACTIVE", "GARNISHING", "SETTLED"])
+            "court_name": f"{rng.choice(COUNTIES)} Superior Court",
+            "county": rng.choice(COUNTIES),
+            "status": rng.choice(["ACTIVE", "GARNISHING", "SETTLED"])
         }))
+        for i in range(50)
+    ]
 
     # 3. Generate 30 Mineral Rights
     print("   ... Generating 30 Mineral Rights")
-    for i in range(30):
-        await agents["mineral_rights"]._create_mineral(SimpleContext({
+    minerals = [
+        agents["mineral_rights"]._build_mineral(ctx.load({
             "tenant_id": TENANT_ID,
-            "legal_description": f"Section {random.randint(1, 36)}, Block {random.randint(1, 100)}",
-            "net_mineral_acres": random.uniform(5.0, 640.0),
-            "royalty_decimal": random.choice([0.125, 0.1875, 0.20, 0.25]),
-            "operator_name": random.choice(COMPANIES),
-            "county": random.choice(COUNTIES),
-            "status": random.choice(["LEASED", "PRODUCING", "OPEN"])
+            "asset_id": f"mineral-{i:04d}",
+            "legal_description": f"Section {rng.randint(1, 36)}, Block {rng.randint(1, 100)}",
+            "net_mineral_acres": rng.uniform(5.0, 640.0),
+            "royalty_decimal": rng.choice([0.125, 0.1875, 0.20, 0.25]),
+            "operator_name": rng.choice(COMPANIES),
+            "county": rng.choice(COUNTIES),
+            "status": rng.choice(["LEASED", "PRODUCING", "OPEN"])
         }))
+        for i in range(30)
+    ]
 
     # 4. Generate 20 Probate Cases
     print("   ... Generating 20 Probate Leads")
-    for i in range(20):
-        await agents["probate"]._create_probate(SimpleContext({
+    probates = [
+        agents["probate"]._build_probate(ctx.load({
             "tenant_id": TENANT_ID,
-            "deceased_name": f"{random.choice(['John', 'Jane', 'Robert', 'Mary'])} {random.choice(NAMES)}",
-            "date_of_death": (datetime.now() - timedelta(days=random.randint(30, 180))).date().isoformat(),
+            "asset_id": f"probate-{i:04d}",
+            "deceased_name": f"{rng.choice(['John', 'Jane', 'Robert', 'Mary'])} {rng.choice(NAMES)}",
+            "date_of_death": (datetime.now() - timedelta(days=rng.randint(30, 180))).date().isoformat(),
             "case_status": "OPEN",
-            "county": random.choice(COUNTIES),
-            "attorney_contact": f"Law Offices of {random.choice(NAMES)}"
+            "county": rng.choice(COUNTIES),
+            "attorney_contact": f"Law Offices of {rng.choice(NAMES)}"
         }))
+        for i in range(20)
+    ]
 
     # 5. Generate 20 Surplus Funds
     print("   ... Generating 20 Surplus Claims")
+    surpluses = []
     for i in range(20):
-        bid = random.randint(200000, 500000)
-        debt = bid - random.randint(20000, 100000)
-        await agents["surplus_funds"]._create_surplus(SimpleContext({
+        bid = rng.randint(200000, 500000)
+        debt = bid - rng.randint(20000, 100000)
+        surpluses.append(agents["surplus_funds"]._build_surplus(ctx.load({
             "tenant_id": TENANT_ID,
-            "foreclosure_date": (datetime.now() - timedelta(days=random.randint(30, 90))).date().isoformat(),
+            "asset_id": f"surplus-{i:04d}",
+            "foreclosure_date": (datetime.now() - timedelta(days=rng.randint(30, 90))).date().isoformat(),
             "winning_bid_amount": bid,
             "total_debt_owed": debt,
             "surplus_amount": bid - debt,
             "claim_deadline": (datetime.now() + timedelta(days=120)).date().isoformat(),
-            "county": random.choice(COUNTIES)
-        }))
+            "county": rng.choice(COUNTIES)
+        })))
+
+    batches = [
+        ("liens", liens),
+        ("judgments", judgments),
+        ("minerals", minerals),
+        ("probates", probates),
+        ("surplus_funds", surpluses),
+    ]
+
+    print("   ... Writing records")
+    # Verticals live in separate collections, so their batches can go out together
+    await asyncio.gather(*(
+        storage.create_many(collection, [to_document(r) for r in records], TENANT_ID)
+        for collection, records in batches
+    ))
+
+    # Redemption deadlines, as LienTrackerAgent creates alongside each lien.
+    # Each is a read plus a write, so run them concurrently in chunks
+    print("   ... Creating redemption deadlines")
+    for start in range(0, len(liens), WRITE_CHUNK_SIZE):
+        await asyncio.gather(*(
+            deadline_agent.run(tenant_id=TENANT_ID, task="create_deadline", lien_ids=[lien.asset_id])
+            for lien in liens[start:start + WRITE_CHUNK_SIZE]
+        ))
 
-    print("🎉 DONE! 170 Assets Loaded.")
+    # Count distinct documents, not records built, so a collision can't inflate the total
+    loaded = sum(len({r.asset_id for r in records}) for _, records in batches)
+    print(f"🎉 DONE! {loaded} Assets Loaded.")
 
 if __name__ == "__main__":
     asyncio.run(generate_bulk_data())
@@ -11,22 +11,39 @@ Usage:
     python scripts/load_mock_data.py
 """
 
+import asyncio
 import os
 import sys
 from datetime import datetime, date, timedelta
-from decimal import Decimal
 import random
 
 # Add parent directory to path to import from core and agents
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
-from core.storage import FirestoreClient
+from core.storage import get_firestore_client
 from core.data_models import LienStatus, PaymentStatus, NotificationType
 
 # Load environment variables
 load_dotenv()
 
+# Set SEED to a non-zero integer for reproducible data
+rng = random.Random(int(os.getenv("SEED", "0")) or None)
+
+# Max storage writes in flight at once
+MAX_CONCURRENT_WRITES = 20
+
+
+async def gather_bounded(coros) -> list:
+    """Await coroutines concurrently, at most MAX_CONCURRENT_WRITES at a time."""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+
+    async def run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
 
 def generate_lien_id(certificate_number: str, sale_date: date) -> str:
     """Generate a lien ID from certificate number and sale date."""
@@ -36,8 +53,8 @@ def generate_lien_id(certificate_number: str, sale_date: date) -> str:
     return f"lien_{cert_base}_{timestamp}"
 
 
-def create_mock_liens() -> list:
-    """Create 12 realistic mock tax liens."""
+def create_mock_liens(now: datetime) -> list:
+    """Create 12 realistic mock tax liens, dated relative to now."""
 
     # Base data for generating realistic liens
     florida_counties = [
@@ -60,16 +77,28 @@ def create_mock_liens() -> list:
         ("963 Fifth Ave", "Naples", "34102"),
     ]
 
-    # Generate liens with realistic variation
+    # Generate liens with realistic variation.
+    # Draw each field's values for all liens in one call up front
     liens = []
-    current_date = date.today()
-
-    for i in range(12):
-        county = random.choice(florida_counties[:3])  # Focus on main 3 counties
-        street, city, zipcode = addresses[i]
+    current_date = now.date()
+    count = len(addresses)
+
+    counties = rng.choices(florida_counties[:3], k=count)  # Focus on main 3 counties
+    months_ago_values = rng.choices(range(6, 19), k=count)
+    purchase_amounts = rng.choices(range(2500, 15000, 500), k=count)
+    interest_rates = rng.choices([12, 15, 18, 18, 18, 24], k=count)  # 18% most common
+    parcel_parts = zip(
+        rng.choices(range(10, 100), k=count),
+        rng.choices(range(1000, 10000), k=count),
+        rng.choices(range(10, 100), k=count),
+        rng.choices(range(100, 1000), k=count),
+    )
+
+    for i, (street, city, zipcode) in enumerate(addresses):
+        county = counties[i]
 
         # Generate dates
-        months_ago = random.randint(6, 18)
+        months_ago = months_ago_values[i]
         sale_date = current_date - timedelta(days=months_ago * 30)
         redemption_deadline = sale_date + timedelta(days=730)  # 2 years
 
@@ -77,12 +106,13 @@ def create_mock_liens() -> list:
         status = "ACTIVE" if i < 10 else "REDEEMED"
 
         # Generate amounts
-        purchase_amount = Decimal(random.randrange(2500, 15000, 500))
-        interest_rate = Decimal(random.choice([12, 15, 18, 18, 18, 24]))  # 18% most common
+        # Floats, as stored in Firestore
+        purchase_amount = float(purchase_amounts[i])
+        interest_rate = float(interest_rates[i])
 
         # Generate IDs
         cert_number = f"{county[:2].upper()}-{sale_date.year}-{1000 + i:04d}"
-        parcel_id = f"{random.randint(10, 99)}-{random.randint(1000, 9999)}-{random.randint(10, 99)}-{random.randint(100, 999)}"
+        parcel_id = "-".join(map(str, next(parcel_parts)))
 
         lien = {
             "certificate_number": cert_number,
@@ -101,9 +131,46 @@ def create_mock_liens() -> list:
     return liens
 
 
-def create_mock_deadlines(lien_ids: list) -> list:
-    """Create 4 mock deadlines for various liens."""
-    current_date = date.today()
+def iso_dates(doc: dict) -> dict:
+    """
+    Convert plain date values to ISO strings in one pass, in place.
+
+    Firestore stores datetimes natively but rejects bare dates, so only
+    `date` instances that aren't `datetime` are converted.
+    """
+    for key, value in doc.items():
+        if type(value) is date:
+            doc[key] = value.isoformat()
+    return doc
+
+
+def prepare_lien(lien_data: dict, tenant_id: str, now: datetime) -> tuple:
+    """
+    Turn a mock lien into a Firestore payload, in place.
+
+    Returns:
+        (payload, original sale date) - the date object is kept for
+        payment calculations, since the payload holds it as a string
+    """
+    # Generate lien ID
+    lien_id = generate_lien_id(lien_data["certificate_number"], lien_data["sale_date"])
+
+    # Keep original date for later calculations
+    sale_date_orig = lien_data["sale_date"]
+
+    # Add required fields
+    lien_data["lien_id"] = lien_id
+    lien_data["tenant_id"] = tenant_id
+    lien_data["created_at"] = now
+    lien_data["updated_at"] = now
+
+    # Convert dates for Firestore compatibility
+    return iso_dates(lien_data), sale_date_orig
+
+
+def create_mock_deadlines(lien_ids: list, now: datetime) -> list:
+    """Create 4 mock deadlines for various liens, dated relative to now."""
+    current_date = now.date()
 
     deadlines = []
 
@@ -122,7 +189,7 @@ def create_mock_deadlines(lien_ids: list) -> list:
             "due_date": current_date + timedelta(days=days_out),
             "description": f"{deadline_type.replace('_', ' ').title()} for {lien_id}",
             "status": "pending",
-            "created_at": datetime.now(),
+            "created_at": now,
         }
 
         deadlines.append(deadline)
@@ -130,19 +197,21 @@ def create_mock_deadlines(lien_ids: list) -> list:
     return deadlines
 
 
-def create_mock_payments(redeemed_liens: list) -> list:
-    """Create payment records for redeemed liens."""
+def create_mock_payments(redeemed_liens: list, now: datetime) -> list:
+    """Create payment records for redeemed liens, dated relative to now."""
     payments = []
+    current_date = now.date()
+    days_ago_values = rng.choices(range(30, 91), k=len(redeemed_liens))
 
-    for lien_data in redeemed_liens:
+    for lien_data, days_ago in zip(redeemed_liens, days_ago_values):
         lien_id = lien_data["lien_id"]
 
         # Calculate redemption amount (principal + interest)
         sale_date = lien_data["sale_date"]
-        payment_date = date.today() - timedelta(days=random.randint(30, 90))
+        payment_date = current_date - timedelta(days=days_ago)
         days_held = (payment_date - sale_date).days
 
-        # Use float arithmetic since we already converted to float
+        # Amounts are already floats
         principal = lien_data["purchase_amount"]
         interest_rate = lien_data["interest_rate"]
         daily_rate = interest_rate / 100 / 365
@@ -155,7 +224,7 @@ def create_mock_payments(redeemed_liens: list) -> list:
             "payment_date": payment_date,
             "status": "COMPLETED",
             "payment_type": "redemption",
-            "created_at": datetime.now(),
+            "created_at": now,
         }
 
         payments.append(payment)
@@ -176,7 +245,7 @@ async def load_data_async(tenant_id: str = "demo-user"):
 
     # Initialize storage
     print("\n📦 Initializing Firestore connection...")
-    storage = FirestoreClient(project_id=project_id)
+    storage = get_firestore_client(project_id)
 
     if storage._use_local:
         print("⚠️  Warning: Using LocalStorageClient (in-memory). Set GOOGLE_PROJECT_ID in .env for production Firestore.")
@@ -184,41 +253,29 @@ async def load_data_async(tenant_id: str = "demo-user"):
 
     print("✓ Connected to Firestore\n")
 
+    # One clock reading for the whole load
+    now = datetime.now()
+    today = now.date()
+
     # Generate mock liens
     print("🏠 Generating mock lien data...")
-    mock_liens = create_mock_liens()
+    mock_liens = create_mock_liens(now)
 
     # Create liens in Firestore
     print(f"📝 Creating {len(mock_liens)} liens...")
     created_liens = []
 
-    for i, lien_data in enumerate(mock_liens, 1):
-        # Generate lien ID
-        lien_id = generate_lien_id(lien_data["certificate_number"], lien_data["sale_date"])
-
-        # Keep original dates for later calculations
-        sale_date_orig = lien_data["sale_date"]
-        redemption_deadline_orig = lien_data["redemption_deadline"]
-
-        # Add required fields
-        lien_data["lien_id"] = lien_id
-        lien_data["tenant_id"] = tenant_id
-        lien_data["created_at"] = datetime.now()
-        lien_data["updated_at"] = datetime.now()
-
-        # Convert types for Firestore compatibility
-        lien_data["purchase_amount"] = float(lien_data["purchase_amount"])
-        lien_data["interest_rate"] = float(lien_data["interest_rate"])
-        lien_data["sale_date"] = sale_date_orig.isoformat()
-        lien_data["redemption_deadline"] = redemption_deadline_orig.isoformat()
-
-        # Create lien using generic create method
-        await storage.create(
-            collection_name="liens",
-            data=lien_data,
-            tenant_id=tenant_id
-        )
+    # Phase 1: prepare every payload in memory, no I/O
+    prepared = [prepare_lien(lien_data, tenant_id, now) for lien_data in mock_liens]
+
+    # Phase 2: create liens using generic create method, all writes in flight together
+    await gather_bounded(
+        storage.create(collection_name="liens", data=lien_data, tenant_id=tenant_id)
+        for lien_data, _ in prepared
+    )
 
+    # Phase 3: report from the in-memory payloads
+    for i, (lien_data, sale_date_orig) in enumerate(prepared, 1):
         # Store lien with original dates for payment calculations
         lien_copy = lien_data.copy()
         lien_copy["sale_date"] = sale_date_orig  # Restore original date object
@@ -234,25 +291,24 @@ async def load_data_async(tenant_id: str = "demo-user"):
     active_liens = [l for l in created_liens if l["status"] == "ACTIVE"]
     lien_ids = [l["lien_id"] for l in active_liens[:4]]
 
-    deadlines = create_mock_deadlines(lien_ids)
+    deadlines = create_mock_deadlines(lien_ids, now)
+    days_until_due = []
 
-    for i, deadline_data in enumerate(deadlines, 1):
+    for deadline_data in deadlines:
         deadline_id = f"deadline_{deadline_data['lien_id']}_{deadline_data['deadline_type']}"
         deadline_data["deadline_id"] = deadline_id
         deadline_data["tenant_id"] = tenant_id
 
         # Calculate days until before converting to string
-        days_until = (deadline_data['due_date'] - date.today()).days
+        days_until_due.append((deadline_data['due_date'] - today).days)
 
         # Convert dates for Firestore compatibility
-        deadline_data["due_date"] = deadline_data["due_date"].isoformat()
+        iso_dates(deadline_data)
 
-        await storage.create(
-            collection_name="deadlines",
-            data=deadline_data,
-            tenant_id=tenant_id
-        )
+    # One batched commit for all deadlines
+    await storage.create_many("deadlines", deadlines, tenant_id)
 
+    for i, (deadline_data, days_until) in enumerate(zip(deadlines, days_until_due), 1):
         print(f"  ⏰ [{i}/4] {deadline_data['deadline_type']:20s} - Due in {days_until:3d} days")
 
     print(f"\n✓ Created {len(deadlines)} deadlines")
@@ -262,23 +318,22 @@ async def load_data_async(tenant_id: str = "demo-user"):
 
     if redeemed_liens:
         print(f"\n💵 Creating payment records for redeemed liens...")
-        payments = create_mock_payments(redeemed_liens)
+        payments = create_mock_payments(redeemed_liens, now)
+        # Shared by every payment ID in this load
+        payment_id_suffix = f"_{int(now.timestamp())}"
 
-        for i, payment_data in enumerate(payments, 1):
-            payment_id = f"payment_{payment_data['lien_id']}_{int(datetime.now().timestamp())}"
+        for payment_data in payments:
+            payment_id = "payment_" + payment_data["lien_id"] + payment_id_suffix
             payment_data["payment_id"] = payment_id
             payment_data["tenant_id"] = tenant_id
 
             # Convert types for Firestore compatibility
-            payment_data["amount"] = float(payment_data["amount"])
-            payment_data["payment_date"] = payment_data["payment_date"].isoformat()
+            iso_dates(payment_data)
 
-            await storage.create(
-                collection_name="payments",
-                data=payment_data,
-                tenant_id=tenant_id
-            )
+        # One batched commit for all payments
+        await storage.create_many("payments", payments, tenant_id)
 
+        for i, payment_data in enumerate(payments, 1):
             print(f"  💰 [{i}/{len(payments)}] Redemption payment: ${payment_data['amount']:>8,.2f}")
 
         print(f"\n✓ Created {len(payments)} payment records")
@@ -308,8 +363,6 @@ async def load_data_async(tenant_id: str = "demo-user"):
 
 def main():
     """Main entry point."""
-    import asyncio
-
     # Get tenant ID from command line or use default
     tenant_id = sys.argv[1] if len(sys.argv) > 1 else "demo-user"
 
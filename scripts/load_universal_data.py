@@ -4,54 +4,15 @@ import asyncio
 import argparse
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Mock Google packages if missing
-import types
-try:
-    import google.auth
-    import google.cloud
-    import google.adk
-except ImportError:
-    # Create module hierarchy
-    google = types.ModuleType("google")
-    sys.modules["google"] = google
-    
-    auth = MagicMock()
-    sys.modules["google.auth"] = auth
-    google.auth = auth
-    
-    cloud = MagicMock()
-    sys.modules["google.cloud"] = cloud
-    google.cloud = cloud
-    
-    firestore = MagicMock()
-    sys.modules["google.cloud.firestore"] = firestore
-    cloud.firestore = firestore
-    
-    genai = MagicMock()
-    sys.modules["google.genai"] = genai
-    google.genai = genai
-    sys.modules["google.genai.types"] = MagicMock()
-    
-    adk = MagicMock()
-    sys.modules["google.adk"] = adk
-    google.adk = adk
-    
-    sys.modules["google.adk.agents"] = MagicMock()
-    sys.modules["google.adk.types"] = MagicMock()
-    sys.modules["google.adk.apps"] = MagicMock()
-    sys.modules["google.adk.apps.app"] = MagicMock()
-    
-    # Mock Agent class specifically if needed by base classes
-    class MockAgent:
-        def __init__(self, *args, **kwargs): pass
-    sys.modules["google.adk.agents"].Agent = MockAgent
+from scripts._mock_google import ensure_google_stubs
+ensure_google_stubs()
 
-from core.storage import FirestoreClient
+from core.storage import get_firestore_client
 # Import Agents
 try:
     from agents.lien_tracker.agent import LienTrackerAgent
@@ -63,6 +24,14 @@ except ImportError as e:
     print(f"Error importing agents: {e}")
     sys.exit(1)
 
+# Max agent runs in flight at once
+MAX_CONCURRENCY = 10
+
+async def _bounded(sem, coro):
+    """Await coro once a semaphore slot is free."""
+    async with sem:
+        return await coro
+
 async def main():
     parser = argparse.ArgumentParser(description="Load mock data for all verticals")
     parser.add_argument("--tenant_id", default="demo-user", help="Tenant ID")
@@ -71,12 +40,27 @@ async def main():
     tenant_id = args.tenant_id
     print(f"Loading data for tenant: {tenant_id}")
     
-    storage = FirestoreClient(project_id="local-dev")
+    storage = get_firestore_client("local-dev")
+
+    # Records are independent, so queue every agent run and let them
+    # overlap, bounded so we don't flood the backend
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    tasks = []
+
+    # All dates are offsets from a single reading of today
+    today = date.today()
+
+    def iso_days_from_today(days: int) -> str:
+        return (today + timedelta(days=days)).isoformat()
+
+    statute_limitations_date = iso_days_from_today(3650)  # 10 years
+    claim_deadline = iso_days_from_today(120)
     
     # 1. Tax Liens
     print("Generating Tax Liens...")
     lien_agent = LienTrackerAgent(storage=storage)
     for i in range(1, 6):
+        sale_date = iso_days_from_today(-i*30)
         data = {
             "certificate_number": f"TL-{2024}-{i:03d}",
             "property_address": f"{100+i} Main St",
@@ -84,13 +68,13 @@ async def main():
             "purchase_amount": 1000 + (i * 100),
             "interest_rate": 18.0,
             "payment_status": "PENDING",
-            "sale_date": (date.today() - timedelta(days=i*30)).isoformat(),
+            "sale_date": sale_date,
             "parcel_id": f"P-{123456+i}",
-            "purchase_date": (date.today() - timedelta(days=i*30)).isoformat(),
-            "redemption_deadline": (date.today() + timedelta(days=365 - i*30)).isoformat(),
+            "purchase_date": sale_date,
+            "redemption_deadline": iso_days_from_today(365 - i*30),
             "status": "ACTIVE"
         }
-        await lien_agent.run(tenant_id=tenant_id, task="create_lien", parameters=data)
+        tasks.append(asyncio.create_task(_bounded(sem, lien_agent.run(tenant_id=tenant_id, task="create_lien", parameters=data))))
         
     # 2. Civil Judgments
     print("Generating Civil Judgments...")
@@ -102,12 +86,12 @@ async def main():
             "plaintiff_name": "Lender LLC",
             "defendant_name": f"Debtor {i}",
             "judgment_amount": 5000 + (i * 500),
-            "judgment_date": (date.today() - timedelta(days=i*60)).isoformat(),
-            "statute_limitations_date": (date.today() + timedelta(days=3650)).isoformat(), # 10 years
+            "judgment_date": iso_days_from_today(-i*60),
+            "statute_limitations_date": statute_limitations_date,
             "status": "ACTIVE",
             "county": "Judgment County"
         }
-        await judgment_agent.run(tenant_id=tenant_id, task="create_judgment", parameters=data)
+        tasks.append(asyncio.create_task(_bounded(sem, judgment_agent.run(tenant_id=tenant_id, task="create_judgment", parameters=data))))
         
     # 3. Probate Estates
     print("Generating Probate Estates...")
@@ -115,16 +99,16 @@ async def main():
     for i in range(1, 6):
         data = {
             "deceased_name": f"John Doe {i}",
-            "date_of_death": (date.today() - timedelta(days=i*100)).isoformat(),
+            "date_of_death": iso_days_from_today(-i*100),
             "case_status": "Open",
             "county": "Probate County",
             "attorney_contact": f"attorney{i}@law.com",
-            "probate_filing_date": (date.today() - timedelta(days=i*80)).isoformat(),
+            "probate_filing_date": iso_days_from_today(-i*80),
             "estimated_value": 200000 + (i * 10000),
             "mortgages_amount": 100000,
             "liens_amount": 5000
         }
-        await probate_agent.run(tenant_id=tenant_id, task="create_probate", parameters=data)
+        tasks.append(asyncio.create_task(_bounded(sem, probate_agent.run(tenant_id=tenant_id, task="create_probate", parameters=data))))
 
     # 4. Mineral Rights
     print("Generating Mineral Rights...")
@@ -136,24 +120,25 @@ async def main():
             "royalty_decimal": 0.125,
             "operator_name": f"Operator {i}",
             "county": "Mineral County",
-            "lease_expiration_date": (date.today() + timedelta(days=365*i)).isoformat()
+            "lease_expiration_date": iso_days_from_today(365*i)
         }
-        await mineral_agent.run(tenant_id=tenant_id, task="create_mineral", parameters=data)
+        tasks.append(asyncio.create_task(_bounded(sem, mineral_agent.run(tenant_id=tenant_id, task="create_mineral", parameters=data))))
 
     # 5. Surplus Funds
     print("Generating Surplus Funds...")
     surplus_agent = SurplusTrackerAgent(storage=storage)
     for i in range(1, 6):
         data = {
-            "foreclosure_date": (date.today() - timedelta(days=i*40)).isoformat(),
+            "foreclosure_date": iso_days_from_today(-i*40),
             "winning_bid_amount": 150000 + (i*1000),
             "total_debt_owed": 100000,
             "surplus_amount": 50000 + (i*1000),
-            "claim_deadline": (date.today() + timedelta(days=120)).isoformat(),
+            "claim_deadline": claim_deadline,
             "county": "Surplus County"
         }
-        await surplus_agent.run(tenant_id=tenant_id, task="create_surplus", parameters=data)
+        tasks.append(asyncio.create_task(_bounded(sem, surplus_agent.run(tenant_id=tenant_id, task="create_surplus", parameters=data))))
 
+    await asyncio.gather(*tasks)
     print("Done!")
 
 if __name__ == "__main__":
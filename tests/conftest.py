@@ -1,12 +1,41 @@
 """Pytest fixtures for LienOS tests."""
 
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+# Mock google.adk if not installed. Done once here, before any test module
+# imports an agent, rather than repeated at the top of every test file.
+try:
+    import google.adk  # noqa: F401
+except ImportError:
+    for _name in (
+        "google.adk",
+        "google.adk.agents",
+        "google.adk.types",
+        "google.adk.apps",
+        "google.adk.apps.app",
+        "google.adk.agents.context_cache_config",
+        "google.adk.apps.events_compaction_config",
+        "google.adk.apps.resumability_config",
+    ):
+        sys.modules[_name] = MagicMock()
+
 import pytest
+import pytest_asyncio
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
 from core.storage import FirestoreClient
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture
 def test_tenant_id():
     """Provide a test tenant ID."""
@@ -16,10 +45,36 @@ def test_tenant_id():
 @pytest.fixture
 def storage():
     """Provide a local storage client for testing."""
-    # Uses local in-memory storage, no Google Cloud needed
+    # Uses local in-memory storage, no Google Cloud needed. Deliberately a
+    # single client: each local client holds its own data, so spreading a
+    # test's calls over several would split its writes from its reads
     return FirestoreClient(project_id="local-dev")
 
 
+@pytest.fixture(scope="session")
+def _storage_template():
+    """Build the storage double once per session; see mock_storage."""
+    storage = MagicMock()
+    storage.get = AsyncMock()
+    storage.create = AsyncMock()
+    storage.query = AsyncMock()
+    return storage
+
+
+@pytest.fixture
+def mock_storage(_storage_template):
+    """
+    Provide a mock storage client with async get/create/query.
+
+    The same double is reused by every test and reset beforehand, including
+    side effects and return values, so tests only configure what they need.
+    A copy would share the child mocks anyway, so there's nothing to gain
+    from one.
+    """
+    _storage_template.reset_mock(return_value=True, side_effect=True)
+    return _storage_template
+
+
 @pytest.fixture
 def sample_lien_data(test_tenant_id):
     """Provide sample lien data for testing."""
@@ -72,15 +127,86 @@ def sample_notification_data():
     }
 
 
+@pytest.fixture(scope="module")
+def _agent_cache():
+    """Agents built so far in this test module, keyed by class."""
+    return {}
+
+
+def _cached_agent(cache, agent_cls, storage):
+    """
+    Return the module's agent_cls instance, pointed at this test's storage.
+
+    Constructing an agent sets up a GenAI client, which is far slower than
+    anything these tests do, so each module builds an agent once and only
+    the storage is swapped per test.
+    """
+    agent = cache.get(agent_cls)
+    if agent is None:
+        agent = cache[agent_cls] = agent_cls(storage=storage)
+    agent.storage = storage
+    return agent
+
+
 @pytest.fixture
-async def created_lien(storage, test_tenant_id, sample_lien_data):
-    """Create and return a lien for testing."""
+def interest_agent(_agent_cache, storage):
+    """Provide an InterestCalculatorAgent backed by the test's storage."""
+    from agents.interest_calculator.agent import InterestCalculatorAgent
+
+    return _cached_agent(_agent_cache, InterestCalculatorAgent, storage)
+
+
+@pytest.fixture
+def deadline_agent(_agent_cache, storage):
+    """Provide a DeadlineAlertAgent backed by the test's storage."""
+    from agents.deadline_alert.agent import DeadlineAlertAgent
+
+    return _cached_agent(_agent_cache, DeadlineAlertAgent, storage)
+
+
+@pytest.fixture
+def judgment_agent(_agent_cache, storage):
+    """Provide a JudgmentTrackerAgent backed by the test's storage."""
+    from agents.judgment_tracker.agent import JudgmentTrackerAgent
+
+    return _cached_agent(_agent_cache, JudgmentTrackerAgent, storage)
+
+
+@pytest.fixture
+def lien_agent(_agent_cache, storage):
+    """Provide a LienTrackerAgent backed by the test's storage."""
     from agents.lien_tracker.agent import LienTrackerAgent
 
-    agent = LienTrackerAgent(storage=storage)
-    result = await agent.run(
-        tenant_id=test_tenant_id,
-        task="create_lien",
-        parameters=sample_lien_data
-    )
-    return result
+    return _cached_agent(_agent_cache, LienTrackerAgent, storage)
+
+
+@pytest.fixture
+def lien_factory(lien_agent, test_tenant_id, sample_lien_data):
+    """
+    Provide an async factory that creates liens through LienTrackerAgent.
+
+    Keyword arguments override fields of sample_lien_data. Results are
+    memoized per (tenant_id, certificate_number), so asking for the same
+    lien again within a test doesn't create it twice.
+    """
+    created = {}
+
+    async def make(tenant_id=None, **overrides):
+        tenant_id = tenant_id or test_tenant_id
+        parameters = {**sample_lien_data, **overrides}
+        key = (tenant_id, parameters["certificate_number"])
+        if key not in created:
+            created[key] = await lien_agent.run(
+                tenant_id=tenant_id,
+                task="create_lien",
+                parameters=parameters
+            )
+        return created[key]
+
+    return make
+
+
+@pytest_asyncio.fixture
+async def created_lien(lien_factory):
+    """Create and return a lien for testing."""
+    return await lien_factory()
@@ -1,119 +1,129 @@
+import asyncio
 import pytest
-import sys
-from unittest.mock import MagicMock, AsyncMock
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-# Mock google.adk dependencies if needed (already done in conftest or here)
-if "google.adk" not in sys.modules:
-    sys.modules["google.adk"] = MagicMock()
-    sys.modules["google.adk.agents"] = MagicMock()
-    sys.modules["google.adk.types"] = MagicMock()
-    sys.modules["google.adk.apps"] = MagicMock()
-    sys.modules["google.adk.apps.app"] = MagicMock()
-
 from agents.interest_calculator.agent import InterestCalculatorAgent
 from agents.deadline_alert.agent import DeadlineAlertAgent
 
-@pytest.mark.asyncio
-async def test_all_verticals_interest_calculation():
-    storage = MagicMock()
-    
-    # Mock data for all 5 types
-    mock_data = {
-        "liens": {"l1": {"purchase_amount": 1000, "interest_rate": 10, "purchase_date": "2023-01-01"}},
-        "judgments": {"j1": {"judgment_amount": 5000, "interest_rate": 5, "judgment_date": "2023-01-01"}},
-        "probate_estates": {"p1": {"estimated_value": 100000, "mortgages_amount": 50000, "liens_amount": 10000}},
-        "minerals": {"m1": {"net_mineral_acres": 10, "royalty_decimal": 0.125}},
-        "surplus_funds": {"s1": {"surplus_amount": 10000}}
-    }
-    
+
+def _serve(storage, mock_data):
+    """Make storage.get serve docs from mock_data, {collection: {asset_id: doc}}."""
     async def mock_get(collection, doc_id, tenant_id):
         return mock_data.get(collection, {}).get(doc_id)
-        
-    storage.get = AsyncMock(side_effect=mock_get)
-    
-    agent = InterestCalculatorAgent(storage=storage)
-    tenant_id = "test-tenant"
 
+    storage.get.side_effect = mock_get
+
+
+_INTEREST_CASES = [
     # 1. Tax Lien
-    res = await agent.run(tenant_id=tenant_id, task="calculate_interest", asset_ids=["l1"])
-    assert res["label"] == "Total Owed"
-    assert res["principal"] == 1000.0
-    
+    ("liens", "l1", {"purchase_amount": 1000, "interest_rate": 10, "purchase_date": "2023-01-01"},
+     "Total Owed", {"principal": 1000.0}),
     # 2. Civil Judgment
-    res = await agent.run(tenant_id=tenant_id, task="calculate_interest", asset_ids=["j1"])
-    assert res["label"] == "Total Owed"
-    assert res["principal"] == 5000.0
-
-    # 3. Probate
-    res = await agent.run(tenant_id=tenant_id, task="calculate_interest", asset_ids=["p1"])
-    assert res["label"] == "Estimated Equity"
-    # 100k - (50k + 10k) = 40k
-    assert res["value"] == 40000.0
+    ("judgments", "j1", {"judgment_amount": 5000, "interest_rate": 5, "judgment_date": "2023-01-01"},
+     "Total Owed", {"principal": 5000.0}),
+    # 3. Probate: 100k - (50k + 10k) = 40k
+    ("probate_estates", "p1", {"estimated_value": 100000, "mortgages_amount": 50000, "liens_amount": 10000},
+     "Estimated Equity", {"value": 40000.0}),
+    # 4. Mineral Rights: 10 * 0.125 * 80 * 30 = 3000
+    ("minerals", "m1", {"net_mineral_acres": 10, "royalty_decimal": 0.125},
+     "Monthly Revenue Estimate", {"value": 3000.0}),
+    # 5. Surplus Funds: 10000 * 0.30 = 3000
+    ("surplus_funds", "s1", {"surplus_amount": 10000},
+     "Potential Fee", {"value": 3000.0}),
+]
 
+_DEADLINE_CASES = [
+    # 1. Tax Lien
+    ("liens", "l1", {"redemption_deadline": "2023-12-31", "property_address": "123 Main"},
+     "redemption", "2023-12-31"),
+    # 2. Civil Judgment
+    ("judgments", "j1", {"statute_limitations_date": "2030-01-01"},
+     "expiration", "2030-01-01"),
+    # 3. Probate: 2023-01-01 + 180 days approx 2023-06-30
+    ("probate_estates", "p1", {"probate_filing_date": "2023-01-01"},
+     "claim_period", "2023-06-30"),
     # 4. Mineral Rights
-    res = await agent.run(tenant_id=tenant_id, task="calculate_interest", asset_ids=["m1"])
-    assert res["label"] == "Monthly Revenue Estimate"
-    # 10 * 0.125 * 80 * 30 = 3000
-    assert res["value"] == 3000.0
-
+    ("minerals", "m1", {"lease_expiration_date": "2025-06-01"},
+     "lease_expiration", "2025-06-01"),
     # 5. Surplus Funds
-    res = await agent.run(tenant_id=tenant_id, task="calculate_interest", asset_ids=["s1"])
-    assert res["label"] == "Potential Fee"
-    # 10000 * 0.30 = 3000
-    assert res["value"] == 3000.0
+    ("surplus_funds", "s1", {"claim_deadline": "2024-01-01"},
+     "escheatment", "2024-01-01"),
+]
 
-@pytest.mark.asyncio
-async def test_all_verticals_deadline_creation():
-    storage = MagicMock()
-    
-    # Mock data for all 5 types
-    mock_data = {
-        "liens": {"l1": {"redemption_deadline": "2023-12-31", "property_address": "123 Main"}},
-        "judgments": {"j1": {"statute_limitations_date": "2030-01-01"}},
-        "probate_estates": {"p1": {"probate_filing_date": "2023-01-01"}},
-        "minerals": {"m1": {"lease_expiration_date": "2025-06-01"}},
-        "surplus_funds": {"s1": {"claim_deadline": "2024-01-01"}}
+
+# What storage.get serves, {collection: {asset_id: doc}}; built once, never mutated
+_INTEREST_MOCK_DATA = {collection: {asset_id: doc} for collection, asset_id, doc, _, _ in _INTEREST_CASES}
+_DEADLINE_MOCK_DATA = {collection: {asset_id: doc} for collection, asset_id, doc, _, _ in _DEADLINE_CASES}
+
+
+@pytest.fixture(scope="module")
+def vertical_agents(_storage_template):
+    """One agent per task for the module, on the shared storage double that mock_storage resets."""
+    return {
+        "interest": InterestCalculatorAgent(storage=_storage_template),
+        "deadline": DeadlineAlertAgent(storage=_storage_template),
     }
-    
-    async def mock_get(collection, doc_id, tenant_id):
-        return mock_data.get(collection, {}).get(doc_id)
-        
-    storage.get = AsyncMock(side_effect=mock_get)
-    storage.create = AsyncMock(return_value=None)
-    
-    agent = DeadlineAlertAgent(storage=storage)
-    tenant_id = "test-tenant"
 
-    # 1. Tax Lien
-    await agent.run(tenant_id=tenant_id, task="create_deadline", asset_ids=["l1"])
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("collection,asset_id,doc,label,expected", _INTEREST_CASES)
+async def test_vertical_interest(mock_storage, vertical_agents, collection, asset_id, doc, label, expected):
+    storage = mock_storage
+    _serve(storage, _INTEREST_MOCK_DATA)
+
+    agent = vertical_agents["interest"]
+    res = await agent.run(tenant_id="test-tenant", task="calculate_interest", asset_ids=[asset_id])
+
+    assert res["label"] == label
+    for key, value in expected.items():
+        assert res[key] == value
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("collection,asset_id,doc,deadline_type,deadline_date", _DEADLINE_CASES)
+async def test_vertical_deadline(mock_storage, vertical_agents, collection, asset_id, doc, deadline_type, deadline_date):
+    storage = mock_storage
+    _serve(storage, _DEADLINE_MOCK_DATA)
+    storage.create.return_value = None
+
+    agent = vertical_agents["deadline"]
+    await agent.run(tenant_id="test-tenant", task="create_deadline", asset_ids=[asset_id])
+
     call_args = storage.create.call_args
     assert call_args[0][0] == "deadlines"
-    assert call_args[0][1]["deadline_type"] == "redemption"
-    assert call_args[0][1]["deadline_date"] == "2023-12-31"
+    assert call_args[0][1]["deadline_type"] == deadline_type
+    assert call_args[0][1]["deadline_date"] == deadline_date
 
-    # 2. Civil Judgment
-    await agent.run(tenant_id=tenant_id, task="create_deadline", asset_ids=["j1"])
-    call_args = storage.create.call_args
-    assert call_args[0][1]["deadline_type"] == "expiration"
-    assert call_args[0][1]["deadline_date"] == "2030-01-01"
 
-    # 3. Probate
-    await agent.run(tenant_id=tenant_id, task="create_deadline", asset_ids=["p1"])
-    call_args = storage.create.call_args
-    assert call_args[0][1]["deadline_type"] == "claim_period"
-    # 2023-01-01 + 180 days approx 2023-06-30
-    assert call_args[0][1]["deadline_date"] == "2023-06-30"
+@pytest.mark.asyncio
+async def test_all_verticals_interest_concurrently(mock_storage, vertical_agents):
+    storage = mock_storage
+    _serve(storage, _INTEREST_MOCK_DATA)
 
-    # 4. Mineral Rights
-    await agent.run(tenant_id=tenant_id, task="create_deadline", asset_ids=["m1"])
-    call_args = storage.create.call_args
-    assert call_args[0][1]["deadline_type"] == "lease_expiration"
-    assert call_args[0][1]["deadline_date"] == "2025-06-01"
+    agent = vertical_agents["interest"]
+    results = await asyncio.gather(*(
+        agent.run(tenant_id="test-tenant", task="calculate_interest", asset_ids=[asset_id])
+        for _, asset_id, _, _, _ in _INTEREST_CASES
+    ))
 
-    # 5. Surplus Funds
-    await agent.run(tenant_id=tenant_id, task="create_deadline", asset_ids=["s1"])
-    call_args = storage.create.call_args
-    assert call_args[0][1]["deadline_type"] == "escheatment"
-    assert call_args[0][1]["deadline_date"] == "2024-01-01"
+    for res, (_, _, _, label, expected) in zip(results, _INTEREST_CASES):
+        assert res["label"] == label
+        for key, value in expected.items():
+            assert res[key] == value
+
+
+@pytest.mark.asyncio
+async def test_all_verticals_deadlines_concurrently(mock_storage, vertical_agents):
+    storage = mock_storage
+    _serve(storage, _DEADLINE_MOCK_DATA)
+    storage.create.return_value = None
+
+    agent = vertical_agents["deadline"]
+    await asyncio.gather(*(
+        agent.run(tenant_id="test-tenant", task="create_deadline", asset_ids=[asset_id])
+        for _, asset_id, _, _, _ in _DEADLINE_CASES
+    ))
+
+    saved = {call[0][1]["deadline_type"]: call[0][1]["deadline_date"] for call in storage.create.call_args_list}
+    assert saved == {deadline_type: deadline_date for _, _, _, deadline_type, deadline_date in _DEADLINE_CASES}
@@ -1,41 +1,25 @@
-import sys
-from unittest.mock import MagicMock
-
-# Mock google.adk if not installed
-if "google.adk" not in sys.modules:
-    sys.modules["google.adk"] = MagicMock()
-    sys.modules["google.adk.agents"] = MagicMock()
-    sys.modules["google.adk.types"] = MagicMock()
-    sys.modules["google.adk.apps"] = MagicMock()
-    sys.modules["google.adk.apps.app"] = MagicMock()
-    sys.modules["google.adk.agents.context_cache_config"] = MagicMock()
-    sys.modules["google.adk.apps.events_compaction_config"] = MagicMock()
-    sys.modules["google.adk.apps.resumability_config"] = MagicMock()
-
 import pytest
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-from agents.interest_calculator.agent import InterestCalculatorAgent
-from agents.lien_tracker.agent import LienTrackerAgent
-from agents.judgment_tracker.agent import JudgmentTrackerAgent
 from core.data_models import CivilJudgment
 
+pytestmark = pytest.mark.multi_agent
+
+_TODAY_PLUS_10Y_ISO = (date.today() + timedelta(days=3650)).isoformat()
+_TODAY_MINUS_100D_ISO = (date.today() - timedelta(days=100)).isoformat()
+
+# 10000 * 0.10 * (100/365) = 1000 * 0.2739... = 273.97
+_EXPECTED_100D_INTEREST = 10000.0 * 0.10 * (100 / 365.0)
+
 
 @pytest.mark.asyncio
-async def test_calculate_interest_tax_lien(storage, test_tenant_id, sample_lien_data):
+async def test_calculate_interest_tax_lien(interest_agent, created_lien, test_tenant_id, sample_lien_data):
     """Test interest calculation for a Tax Lien (legacy support)."""
-    # Create a lien
-    lien_agent = LienTrackerAgent(storage=storage)
-    create_result = await lien_agent.run(
-        tenant_id=test_tenant_id,
-        task="create_lien",
-        parameters=sample_lien_data
-    )
-    lien_id = create_result["lien_id"]
+    lien_id = created_lien["lien_id"]
 
     # Calculate interest
-    agent = InterestCalculatorAgent(storage=storage)
+    agent = interest_agent
     result = await agent.run(
         tenant_id=test_tenant_id,
         task="calculate_interest",
@@ -50,22 +34,21 @@ async def test_calculate_interest_tax_lien(storage, test_tenant_id, sample_lien_
 
 
 @pytest.mark.asyncio
-async def test_calculate_interest_civil_judgment(storage, test_tenant_id):
+async def test_calculate_interest_civil_judgment(interest_agent, judgment_agent, test_tenant_id):
     """Test interest calculation for a Civil Judgment."""
     # Create a judgment
     judgment_data = {
         "case_number": "CASE-2024-001",
         "court_name": "Superior Court",
-        "judgment_date": (date.today() - timedelta(days=100)).isoformat(),
+        "judgment_date": _TODAY_MINUS_100D_ISO,
         "defendant_name": "John Doe",
         "judgment_amount": 10000.00,
         "interest_rate": 10.0,
         "status": "ACTIVE",
         "county": "Test County",
-        "statute_limitations_date": (date.today() + timedelta(days=3650)).isoformat()
+        "statute_limitations_date": _TODAY_PLUS_10Y_ISO
     }
 
-    judgment_agent = JudgmentTrackerAgent(storage=storage)
     create_result = await judgment_agent.run(
         tenant_id=test_tenant_id,
         task="create_judgment",
@@ -75,7 +58,7 @@ async def test_calculate_interest_civil_judgment(storage, test_tenant_id):
 
     # Calculate interest using asset_ids
     # Note: InterestCalculatorAgent should handle context.asset_ids
-    agent = InterestCalculatorAgent(storage=storage)
+    agent = interest_agent
     result = await agent.run(
         tenant_id=test_tenant_id,
         task="calculate_interest",
@@ -89,8 +72,5 @@ async def test_calculate_interest_civil_judgment(storage, test_tenant_id):
     assert result["principal"] == 10000.00
     assert result["interest_rate"] == 10.0
     assert result["days_elapsed"] == 100
-    
-    # 10000 * 0.10 * (100/365) = 1000 * 0.2739... = 273.97
-    expected_interest = 10000.0 * 0.10 * (100 / 365.0)
-    assert abs(result["interest_accrued"] - expected_interest) < 0.1
+    assert result["interest_accrued"] == pytest.approx(_EXPECTED_100D_INTEREST, abs=0.1)
     assert result["total_owed"] > 10000.0
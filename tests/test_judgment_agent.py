@@ -1,16 +1,19 @@
+import asyncio
 import pytest
 from datetime import date, datetime
 from decimal import Decimal
-from agents.judgment_tracker.agent import JudgmentTrackerAgent
-from core.storage import FirestoreClient
+from core.storage import LocalStorageClient
+
+_TODAY_ISO = date.today().isoformat()
 
 @pytest.fixture
 def storage():
-    return FirestoreClient(project_id="local-dev")
+    # The in-memory store directly, without the FirestoreClient wrapper
+    return LocalStorageClient()
 
 @pytest.fixture
-def agent(storage):
-    return JudgmentTrackerAgent(storage=storage)
+def agent(judgment_agent):
+    return judgment_agent
 
 @pytest.fixture
 def tenant_id():
@@ -21,7 +24,7 @@ async def test_create_judgment(agent, tenant_id):
     params = {
         "case_number": "CASE-2024-001",
         "court_name": "Circuit Court",
-        "judgment_date": date.today().isoformat(),
+        "judgment_date": _TODAY_ISO,
         "defendant_name": "John Doe",
         "judgment_amount": 5000.00,
         "county": "Test County",
@@ -44,7 +47,7 @@ async def test_get_judgment(agent, tenant_id):
     create_params = {
         "case_number": "CASE-2024-002",
         "court_name": "Circuit Court",
-        "judgment_date": date.today().isoformat(),
+        "judgment_date": _TODAY_ISO,
         "defendant_name": "Jane Doe",
         "judgment_amount": 7500.00,
         "county": "Test County"
@@ -73,7 +76,7 @@ async def test_update_judgment(agent, tenant_id):
     create_params = {
         "case_number": "CASE-2024-003",
         "court_name": "Circuit Court",
-        "judgment_date": date.today().isoformat(),
+        "judgment_date": _TODAY_ISO,
         "defendant_name": "Bob Smith",
         "judgment_amount": 1000.00,
         "county": "Test County"
@@ -106,21 +109,23 @@ async def test_update_judgment(agent, tenant_id):
 
 @pytest.mark.asyncio
 async def test_list_judgments(agent, tenant_id):
-    # Create a few judgments
-    for i in range(3):
-        await agent.run(
+    # Create a few judgments, concurrently
+    await asyncio.gather(*[
+        agent.run(
             tenant_id=tenant_id,
             task="create_judgment",
             parameters={
                 "case_number": f"LIST-CASE-{i}",
                 "court_name": "Circuit Court",
-                "judgment_date": date.today().isoformat(),
+                "judgment_date": _TODAY_ISO,
                 "defendant_name": f"Defendant {i}",
                 "judgment_amount": 1000.00 + (i * 100),
                 "county": "List County",
                 "status": "ACTIVE" if i < 2 else "SATISFIED"
             }
         )
+        for i in range(3)
+    ])
     
     # List all
     result = await agent.run(
@@ -1,27 +1,25 @@
 import pytest
-import sys
-from unittest.mock import MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from datetime import date, datetime
 from decimal import Decimal
 
-# Mock google.adk dependencies
-if "google.adk" not in sys.modules:
-    sys.modules["google.adk"] = MagicMock()
-    sys.modules["google.adk.agents"] = MagicMock()
-    sys.modules["google.adk.types"] = MagicMock()
-    sys.modules["google.adk.apps"] = MagicMock()
-    sys.modules["google.adk.apps.app"] = MagicMock()
-
 from agents.mineral_tracker.agent import MineralTrackerAgent
 from core.data_models import AssetType
 
+@pytest.fixture(scope="module")
+def mineral_agent_with_storage():
+    """One agent per module; tests reset the storage mock they use."""
+    storage = SimpleNamespace(create=AsyncMock(), query=AsyncMock(), get=AsyncMock())
+    return MineralTrackerAgent(storage=storage), storage
+
 @pytest.mark.asyncio
-async def test_create_mineral_right():
+async def test_create_mineral_right(mineral_agent_with_storage):
     # Setup
-    storage = MagicMock()
-    storage.create = AsyncMock(return_value=None)
+    agent, storage = mineral_agent_with_storage
+    storage.create.reset_mock()
+    storage.create.return_value = None
     
-    agent = MineralTrackerAgent(storage=storage)
     tenant_id = "test-tenant"
     
     params = {
@@ -56,16 +54,16 @@ async def test_create_mineral_right():
     assert saved_data["net_mineral_acres"] == 12.5
 
 @pytest.mark.asyncio
-async def test_list_mineral_rights():
+async def test_list_mineral_rights(mineral_agent_with_storage):
     # Setup
-    storage = MagicMock()
+    agent, storage = mineral_agent_with_storage
     mock_minerals = [
         {"id": "m1", "legal_description": "Desc 1", "operator_name": "Op 1"},
         {"id": "m2", "legal_description": "Desc 2", "operator_name": "Op 2"}
     ]
-    storage.query = AsyncMock(return_value=mock_minerals)
+    storage.query.reset_mock()
+    storage.query.return_value = mock_minerals
     
-    agent = MineralTrackerAgent(storage=storage)
     tenant_id = "test-tenant"
     
     # Execute
@@ -3,78 +3,105 @@ from datetime import date, datetime
 from decimal import Decimal
 from core.data_models import Asset, TaxLien, CivilJudgment, AssetType, Lien
 
-def test_tax_lien_creation():
-    lien = TaxLien(
-        asset_id="lien-123",
-        tenant_id="tenant-1",
-        certificate_number="CERT-001",
-        purchase_amount=Decimal("1000.00"),
-        interest_rate=Decimal("12.0"),
-        sale_date=date(2023, 1, 1),
-        redemption_deadline=date(2024, 1, 1),
-        status="ACTIVE",
-        property_address="123 Main St",
-        parcel_id="PARCEL-1",
-        county="Test County",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
+_NOW = datetime.utcnow()
+_TODAY = date.today()
+
+# Decimal is immutable, so each amount is parsed once and shared
+_D_ZERO = Decimal("0")
+_D_5 = Decimal("5.0")
+_D_10 = Decimal("10")
+_D_12 = Decimal("12.0")
+_D_18 = Decimal("18")
+_D_100 = Decimal("100")
+_D_500 = Decimal("500")
+_D_1000 = Decimal("1000.00")
+_D_1500 = Decimal("1500.00")
+_D_2000 = Decimal("2000.00")
+_D_5000 = Decimal("5000.00")
+
+_TAX_LIEN_FIELDS = {
+    "asset_id": "lien-123",
+    "tenant_id": "tenant-1",
+    "certificate_number": "CERT-001",
+    "purchase_amount": _D_1000,
+    "interest_rate": _D_12,
+    "sale_date": date(2023, 1, 1),
+    "redemption_deadline": date(2024, 1, 1),
+    "status": "ACTIVE",
+    "property_address": "123 Main St",
+    "parcel_id": "PARCEL-1",
+    "county": "Test County",
+    "created_at": _NOW,
+    "updated_at": _NOW,
+}
+
+_CIVIL_JUDGMENT_FIELDS = {
+    "asset_id": "judg-123",
+    "tenant_id": "tenant-1",
+    "purchase_amount": _D_5000, # Usually 0 or cost to acquire
+    "interest_rate": _D_5,
+    "status": "ACTIVE",
+    "county": "Test County",
+    "case_number": "CASE-001",
+    "court_name": "Superior Court",
+    "judgment_date": date(2023, 6, 1),
+    "defendant_name": "John Doe",
+    "judgment_amount": _D_5000,
+    "created_at": _NOW,
+    "updated_at": _NOW,
+}
+
+
+@pytest.fixture(scope="module")
+def tax_lien_factory():
+    """Build a validated TaxLien from the shared fields plus overrides."""
+    return lambda **overrides: TaxLien(**{**_TAX_LIEN_FIELDS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def civil_judgment_factory():
+    """Build a validated CivilJudgment from the shared fields plus overrides."""
+    return lambda **overrides: CivilJudgment(**{**_CIVIL_JUDGMENT_FIELDS, **overrides})
+
+def test_tax_lien_creation(tax_lien_factory):
+    lien = tax_lien_factory()
     assert lien.asset_type == AssetType.TAX_LIEN
     assert lien.lien_id == "lien-123"
     assert isinstance(lien, Asset)
 
-def test_civil_judgment_creation():
-    judgment = CivilJudgment(
-        asset_id="judg-123",
-        tenant_id="tenant-1",
-        purchase_amount=Decimal("5000.00"), # Usually 0 or cost to acquire
-        interest_rate=Decimal("5.0"),
-        status="ACTIVE",
-        county="Test County",
-        case_number="CASE-001",
-        court_name="Superior Court",
-        judgment_date=date(2023, 6, 1),
-        defendant_name="John Doe",
-        judgment_amount=Decimal("5000.00"),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
+def test_civil_judgment_creation(civil_judgment_factory):
+    judgment = civil_judgment_factory()
     assert judgment.asset_type == AssetType.CIVIL_JUDGMENT
     assert judgment.asset_id == "judg-123"
     assert isinstance(judgment, Asset)
 
 def test_lien_alias():
-    # Test that Lien alias works and creates a TaxLien
+    # Test that Lien alias works and creates a TaxLien; constructed (and
+    # validated) through the alias rather than copied from a template
     lien = Lien(
-        lien_id="lien-alias-123", # Note: using lien_id alias if supported, or asset_id
-        asset_id="lien-alias-123", # Pydantic might require the actual field name if alias not set in Field
-        tenant_id="tenant-1",
-        certificate_number="CERT-ALIAS",
-        purchase_amount=Decimal("2000.00"),
-        interest_rate=Decimal("10.0"),
-        sale_date=date(2023, 1, 1),
-        redemption_deadline=date(2024, 1, 1),
-        status="ACTIVE",
-        property_address="456 Elm St",
-        parcel_id="PARCEL-2",
-        county="Test County",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        **{
+            **_TAX_LIEN_FIELDS,
+            "lien_id": "lien-alias-123", # Note: using lien_id alias if supported, or asset_id
+            "asset_id": "lien-alias-123", # Pydantic might require the actual field name if alias not set in Field
+            "certificate_number": "CERT-ALIAS",
+            "purchase_amount": _D_2000,
+            "interest_rate": _D_10,
+            "property_address": "456 Elm St",
+            "parcel_id": "PARCEL-2",
+        }
     )
     assert isinstance(lien, TaxLien)
     assert lien.asset_type == AssetType.TAX_LIEN
 
-def test_polymorphism():
+def test_polymorphism(tax_lien_factory, civil_judgment_factory):
     assets = [
-        TaxLien(
-            asset_id="1", tenant_id="t1", certificate_number="C1", purchase_amount=Decimal("100"), interest_rate=Decimal("10"),
-            sale_date=date.today(), redemption_deadline=date.today(), status="ACTIVE", property_address="A", parcel_id="P1", county="C",
-            created_at=datetime.utcnow(), updated_at=datetime.utcnow()
+        tax_lien_factory(
+            asset_id="1", tenant_id="t1", certificate_number="C1", purchase_amount=_D_100, interest_rate=_D_10,
+            sale_date=_TODAY, redemption_deadline=_TODAY, property_address="A", parcel_id="P1", county="C"
         ),
-        CivilJudgment(
-            asset_id="2", tenant_id="t1", purchase_amount=Decimal("0"), interest_rate=Decimal("5"), status="A", county="C",
-            case_number="CN1", court_name="CN", judgment_date=date.today(), defendant_name="DN", judgment_amount=Decimal("500"),
-            created_at=datetime.utcnow(), updated_at=datetime.utcnow()
+        civil_judgment_factory(
+            asset_id="2", tenant_id="t1", purchase_amount=_D_ZERO, status="A", county="C",
+            case_number="CN1", court_name="CN", judgment_date=_TODAY, defendant_name="DN", judgment_amount=_D_500
         )
     ]
     
@@ -83,3 +110,22 @@ def test_polymorphism():
     assert isinstance(assets[1], Asset)
     assert assets[0].asset_type == AssetType.TAX_LIEN
     assert assets[1].asset_type == AssetType.CIVIL_JUDGMENT
+
+def test_from_dict_round_trip(tax_lien_factory):
+    lien = tax_lien_factory(
+        asset_id="lien-rt", tenant_id="t1", certificate_number="C-RT", purchase_amount=_D_1500,
+        interest_rate=_D_18, redemption_deadline=date(2025, 1, 1),
+        property_address="A", parcel_id="P1", county="C"
+    )
+
+    restored = Lien.from_dict(lien.model_dump())
+
+    assert isinstance(restored, TaxLien)
+    assert restored == lien
+
+def test_trusted_skips_validation():
+    lien = Lien.trusted({"asset_id": "lien-trusted", "tenant_id": "t1", "purchase_amount": _D_100})
+
+    assert isinstance(lien, TaxLien)
+    assert lien.asset_id == "lien-trusted"
+    assert lien.asset_type == AssetType.TAX_LIEN
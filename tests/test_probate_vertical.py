@@ -1,27 +1,25 @@
 import pytest
-import sys
-from unittest.mock import MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from datetime import date, datetime
 
-# Mock google.adk dependencies
-if "google.adk" not in sys.modules:
-    sys.modules["google.adk"] = MagicMock()
-    sys.modules["google.adk.agents"] = MagicMock()
-    sys.modules["google.adk.types"] = MagicMock()
-    sys.modules["google.adk.apps"] = MagicMock()
-    sys.modules["google.adk.apps.app"] = MagicMock()
-
 from agents.probate_tracker.agent import ProbateTrackerAgent
 from core.verticals.probate import ProbateEstate
 from core.data_models import AgentContext
 
+@pytest.fixture(scope="module")
+def probate_agent_with_storage():
+    """One agent per module; tests reset the storage mock they use."""
+    storage = SimpleNamespace(create=AsyncMock(), query=AsyncMock(), get=AsyncMock())
+    return ProbateTrackerAgent(storage=storage), storage
+
 @pytest.mark.asyncio
-async def test_create_probate_estate():
+async def test_create_probate_estate(probate_agent_with_storage):
     # Setup
-    storage = MagicMock()
-    storage.create = AsyncMock(return_value=None)
+    agent, storage = probate_agent_with_storage
+    storage.create.reset_mock()
+    storage.create.return_value = None
     
-    agent = ProbateTrackerAgent(storage=storage)
     tenant_id = "test-tenant"
     
     params = {
@@ -53,16 +51,16 @@ async def test_create_probate_estate():
     assert saved_data["asset_type"] == "PROBATE"
 
 @pytest.mark.asyncio
-async def test_list_probate_estates():
+async def test_list_probate_estates(probate_agent_with_storage):
     # Setup
-    storage = MagicMock()
+    agent, storage = probate_agent_with_storage
     mock_probates = [
         {"id": "p1", "deceased_name": "A", "created_at": "2023-01-01"},
         {"id": "p2", "deceased_name": "B", "created_at": "2023-01-02"}
     ]
-    storage.query = AsyncMock(return_value=mock_probates)
+    storage.query.reset_mock()
+    storage.query.return_value = mock_probates
     
-    agent = ProbateTrackerAgent(storage=storage)
     tenant_id = "test-tenant"
     
     # Execute
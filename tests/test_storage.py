@@ -0,0 +1,583 @@
+"""Tests for the storage layer."""
+
+import itertools
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from core.storage import FirestoreClient, LocalStorageClient, get_firestore_client
+
+
+class TestFirestoreClientLocal:
+    """Tests for FirestoreClient backed by local in-memory storage."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_update(self, storage, test_tenant_id):
+        """Test updating several documents at once."""
+        doc_ids = [
+            await storage.create("liens", {"status": "ACTIVE"}, test_tenant_id)
+            for _ in range(3)
+        ]
+
+        results = await storage.bulk_update(
+            "liens",
+            {doc_id: {"status": "REDEEMED"} for doc_id in doc_ids},
+            test_tenant_id
+        )
+
+        assert results == [True, True, True]
+        for doc_id in doc_ids:
+            doc = await storage.get("liens", doc_id, test_tenant_id)
+            assert doc["status"] == "REDEEMED"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_other_tenant(self, storage, test_tenant_id):
+        """Test that bulk updates respect tenant isolation."""
+        doc_id = await storage.create("liens", {"status": "ACTIVE"}, test_tenant_id)
+
+        results = await storage.bulk_update("liens", {doc_id: {"status": "REDEEMED"}}, "other-tenant")
+
+        assert results == [False]
+        doc = await storage.get("liens", doc_id, test_tenant_id)
+        assert doc["status"] == "ACTIVE"
+
+    @pytest.mark.asyncio
+    async def test_tenant_isolation(self, storage, test_tenant_id):
+        """Test that tenants can only see their own documents."""
+        doc_id = await storage.create("liens", {"county": "A"}, test_tenant_id)
+        await storage.create("liens", {"county": "B"}, "other-tenant")
+
+        assert await storage.get("liens", doc_id, "other-tenant") is None
+        assert await storage.delete("liens", doc_id, "other-tenant") is False
+
+        results = await storage.query("liens", test_tenant_id)
+        assert [d["county"] for d in results] == ["A"]
+
+    @pytest.mark.asyncio
+    async def test_query_filters_order_limit(self, storage, test_tenant_id):
+        """Test combining filters, ordering and limit."""
+        for amount, county in [(500, "A"), (1500, "A"), (2500, "B"), (3500, "A")]:
+            await storage.create("liens", {"purchase_amount": amount, "county": county}, test_tenant_id)
+
+        results = await storage.query(
+            "liens",
+            test_tenant_id,
+            filters=[("county", "==", "A"), ("purchase_amount", ">=", 1000)],
+            order_by="-purchase_amount",
+            limit=1
+        )
+
+        assert [d["purchase_amount"] for d in results] == [3500]
+
+    @pytest.mark.asyncio
+    async def test_query_missing_fields(self, storage, test_tenant_id):
+        """Test that missing fields match equality filters but not range filters."""
+        await storage.create("liens", {"purchase_amount": 500}, test_tenant_id)
+        await storage.create("liens", {}, test_tenant_id)
+
+        assert len(await storage.query("liens", test_tenant_id, filters=[("purchase_amount", "==", None)])) == 1
+        assert len(await storage.query("liens", test_tenant_id, filters=[("purchase_amount", "!=", None)])) == 1
+        assert len(await storage.query("liens", test_tenant_id, filters=[("purchase_amount", "<", 1000)])) == 1
+
+    @pytest.mark.asyncio
+    async def test_query_latest_without_filters(self, storage, test_tenant_id):
+        """Test unfiltered queries ordered by creation time."""
+        doc_ids = [await storage.create("liens", {"n": n}, test_tenant_id) for n in range(4)]
+        await storage.create("liens", {"n": 4}, "other_tenant")
+        # Re-creating a document moves it to the newest position
+        await storage.create("liens", {"id": doc_ids[0], "n": 0}, test_tenant_id)
+
+        latest = await storage.query("liens", test_tenant_id, order_by="-created_at", limit=2)
+        oldest = await storage.query("liens", test_tenant_id, order_by="created_at", limit=2)
+
+        assert [d["n"] for d in latest] == [0, 3]
+        assert [d["n"] for d in oldest] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_query_latest_keeps_batch_order(self, storage, test_tenant_id):
+        """Test that documents sharing a timestamp stay in insertion order, newest first."""
+        await storage.create("liens", {"n": 0}, test_tenant_id)
+        await storage.create_many("liens", [{"n": n} for n in range(1, 4)], test_tenant_id)
+
+        latest = await storage.query("liens", test_tenant_id, order_by="-created_at")
+        # Same ordering as the general (stable sort) path
+        sorted_latest = await storage.query(
+            "liens", test_tenant_id, filters=[("n", ">=", 0)], order_by="-created_at"
+        )
+
+        assert [d["n"] for d in latest] == [1, 2, 3, 0]
+        assert [d["n"] for d in latest] == [d["n"] for d in sorted_latest]
+
+    @pytest.mark.asyncio
+    async def test_query_latest_after_created_at_update(self, storage, test_tenant_id):
+        """Test that rewriting created_at reorders unfiltered queries by creation time."""
+        doc_ids = [await storage.create("liens", {"n": n}, test_tenant_id) for n in range(3)]
+        # Backdate the newest document past the oldest
+        await storage.update("liens", doc_ids[2], {"created_at": datetime(2000, 1, 1)}, test_tenant_id)
+
+        latest = await storage.query("liens", test_tenant_id, order_by="-created_at")
+        oldest = await storage.query("liens", test_tenant_id, order_by="created_at", limit=1)
+
+        assert [d["n"] for d in latest] == [1, 0, 2]
+        assert [d["n"] for d in oldest] == [2]
+
+    @pytest.mark.asyncio
+    async def test_query_returns_copies(self, storage, test_tenant_id):
+        """Test that mutating query results doesn't change stored documents."""
+        doc_id = await storage.create("liens", {"status": "ACTIVE"}, test_tenant_id)
+
+        results = await storage.query("liens", test_tenant_id)
+        results[0]["status"] = "REDEEMED"
+
+        doc = await storage.get("liens", doc_id, test_tenant_id)
+        assert doc["status"] == "ACTIVE"
+
+    @pytest.mark.asyncio
+    async def test_query_order_by_missing_field(self, storage, test_tenant_id):
+        """Test ordering when some documents lack the order_by field."""
+        await storage.create("liens", {"county": "B"}, test_tenant_id)
+        await storage.create("liens", {}, test_tenant_id)
+        await storage.create("liens", {"county": "A"}, test_tenant_id)
+
+        results = await storage.query("liens", test_tenant_id, order_by="county")
+
+        assert [d.get("county") for d in results] == [None, "A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, storage, test_tenant_id):
+        """Test creating several documents in one call."""
+        doc_ids = await storage.create_many(
+            "payments",
+            [{"amount": 100.0}, {"id": "pmt-fixed", "amount": 200.0}],
+            test_tenant_id
+        )
+
+        assert len(doc_ids) == 2
+        assert doc_ids[1] == "pmt-fixed"
+        doc = await storage.get("payments", doc_ids[0], test_tenant_id)
+        assert doc["amount"] == 100.0
+        assert doc["tenant_id"] == test_tenant_id
+
+    @pytest.mark.asyncio
+    async def test_create_many_shares_timestamp(self, storage, test_tenant_id):
+        """Test that a batch of creates is stamped with a single time."""
+        doc_ids = await storage.create_many("payments", [{"amount": 1.0}, {"amount": 2.0}], test_tenant_id)
+
+        docs = await storage.get_many("payments", doc_ids, test_tenant_id)
+
+        assert docs[0]["created_at"] == docs[1]["created_at"] == docs[1]["updated_at"]
+
+    @pytest.mark.asyncio
+    async def test_update_many(self, storage, test_tenant_id):
+        """Test updating several documents in one call."""
+        doc_id = await storage.create("payments", {"status": "PENDING"}, test_tenant_id)
+
+        results = await storage.update_many(
+            "payments",
+            {doc_id: {"status": "COMPLETED"}, "missing": {"status": "COMPLETED"}},
+            test_tenant_id
+        )
+
+        assert results == [True, False]
+        doc = await storage.get("payments", doc_id, test_tenant_id)
+        assert doc["status"] == "COMPLETED"
+
+    @pytest.mark.asyncio
+    async def test_get_many(self, storage, test_tenant_id):
+        """Test fetching several documents keeps order and tenant isolation."""
+        own_id = await storage.create("liens", {"county": "Harris"}, test_tenant_id)
+        other_id = await storage.create("liens", {"county": "Dallas"}, "other_tenant")
+
+        docs = await storage.get_many("liens", [own_id, "missing", other_id], test_tenant_id)
+
+        assert docs[0]["county"] == "Harris"
+        assert docs[1] is None
+        assert docs[2] is None
+
+    @pytest.mark.asyncio
+    async def test_immutable_reads_return_read_only_views(self, test_tenant_id):
+        """Test that immutable_reads hands out views instead of copies."""
+        client = LocalStorageClient(immutable_reads=True)
+        doc_id = await client.create("liens", {"county": "Harris"}, test_tenant_id)
+
+        doc = await client.get("liens", doc_id, test_tenant_id)
+        results = await client.query("liens", test_tenant_id)
+
+        with pytest.raises(TypeError):
+            doc["county"] = "Dallas"
+        with pytest.raises(TypeError):
+            results[0]["county"] = "Dallas"
+
+        assert await client.update("liens", doc_id, {"county": "Dallas"}, test_tenant_id)
+        assert doc["county"] == "Dallas"
+
+    def test_sanitize_data_converts_nested_decimals(self, storage):
+        """Test that Decimals are converted to float without mutating the input."""
+        data = {"amount": Decimal("1.50"), "history": [{"amount": Decimal("2")}], "note": "x"}
+
+        sanitized = storage._sanitize_data(data)
+
+        assert sanitized == {"amount": 1.5, "history": [{"amount": 2.0}], "note": "x"}
+        assert isinstance(data["history"][0]["amount"], Decimal)
+
+    def test_sanitize_data_without_decimals(self, storage):
+        """Test that data without Decimals is passed through unchanged."""
+        data = {"amount": 1.5, "history": [{"amount": 2}]}
+
+        assert storage._sanitize_data(data) is data
+
+    def test_get_firestore_client_is_shared(self):
+        """Test that the client factory reuses one client per project."""
+        assert get_firestore_client("local-dev") is get_firestore_client("local-dev")
+
+
+class FakeSnapshot:
+    """Stand-in for a Firestore DocumentSnapshot."""
+
+    def __init__(self, doc_id, data, update_time):
+        self.id = doc_id
+        self.exists = data is not None
+        self.update_time = update_time
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocument:
+    """Stand-in for a Firestore DocumentReference, recording every RPC."""
+
+    def __init__(self, db, collection, doc_id):
+        self.db = db
+        self.collection = collection
+        self.id = doc_id
+
+    @property
+    def key(self):
+        return (self.collection, self.id)
+
+    def _check(self, option):
+        """Enforce a last_update_time precondition like Firestore does."""
+        from google.api_core.exceptions import FailedPrecondition, NotFound
+
+        if self.key not in self.db.docs:
+            raise NotFound(self.id)
+        if option is not None and self.db.update_times[self.key] != option:
+            raise FailedPrecondition(self.id)
+
+    def _touch(self):
+        update_time = next(self.db.clock)
+        self.db.update_times[self.key] = update_time
+        return SimpleNamespace(update_time=update_time)
+
+    def get(self):
+        self.db.calls.append(("get", self.id))
+        return self.db.snapshot(self.key)
+
+    def set(self, data):
+        self.db.calls.append(("set", self.id))
+        self.db.docs[self.key] = dict(data)
+        return self._touch()
+
+    def update(self, data, option=None):
+        self.db.calls.append(("update", self.id))
+        self._check(option)
+        self.db.docs[self.key].update(data)
+        return self._touch()
+
+    def delete(self, option=None):
+        self.db.calls.append(("delete", self.id))
+        if option is not None:
+            self._check(option)
+        self.db.docs.pop(self.key, None)
+        self.db.update_times.pop(self.key, None)
+
+
+class FakeBatch:
+    """Stand-in for a Firestore WriteBatch, with the 500-write limit."""
+
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def set(self, ref, data):
+        self.writes.append((ref.set, data))
+
+    def update(self, ref, data):
+        self.writes.append((ref.update, data))
+
+    def commit(self):
+        assert len(self.writes) <= 500, "Firestore rejects batches over 500 writes"
+        self.db.commits.append(len(self.writes))
+        return [write(data) for write, data in self.writes]
+
+
+class FakeFirestoreDB:
+    """In-memory stand-in for google.cloud.firestore.Client."""
+
+    def __init__(self):
+        self.docs = {}
+        self.update_times = {}
+        self.clock = itertools.count(1)
+        self.calls = []
+        self.commits = []
+
+    def collection(self, name):
+        return SimpleNamespace(document=lambda doc_id: FakeDocument(self, name, doc_id))
+
+    def snapshot(self, key):
+        return FakeSnapshot(key[1], self.docs.get(key), self.update_times.get(key))
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def write_option(self, last_update_time):
+        return last_update_time
+
+    def get_all(self, refs):
+        self.calls.append(("get_all", len(refs)))
+        # Firestore streams results back in no particular order
+        return reversed([self.snapshot(ref.key) for ref in refs])
+
+    def close(self):
+        pass
+
+    def seed(self, collection, doc_id, data):
+        """Store a document directly, without recording an RPC."""
+        key = (collection, doc_id)
+        self.docs[key] = dict(data)
+        self.update_times[key] = next(self.clock)
+
+    def rpcs(self, op):
+        return [doc_id for name, doc_id in self.calls if name == op]
+
+
+@pytest.fixture
+def remote_storage():
+    """Provide a FirestoreClient on its remote code path, backed by FakeFirestoreDB."""
+    pytest.importorskip("google.cloud.firestore")
+    client = FirestoreClient(project_id="test-project")
+    client._db = FakeFirestoreDB()
+    yield client
+    client._executor.shutdown()
+
+
+class TestFirestoreClientRemote:
+    """Tests for FirestoreClient's Firestore code path, against a fake database."""
+
+    @pytest.mark.asyncio
+    async def test_update_cached_owner_skips_read(self, remote_storage, test_tenant_id):
+        """Test that an update after get() is a single conditional write."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": test_tenant_id, "status": "ACTIVE"})
+        await remote_storage.get("liens", "l1", test_tenant_id)
+        db.calls.clear()
+
+        assert await remote_storage.update("liens", "l1", {"status": "REDEEMED"}, test_tenant_id)
+
+        assert db.calls == [("update", "l1")]
+        assert db.docs[("liens", "l1")]["status"] == "REDEEMED"
+
+    @pytest.mark.asyncio
+    async def test_update_stale_cache_rechecks_owner(self, remote_storage, test_tenant_id):
+        """Test that a failed precondition evicts the cache entry and re-verifies the tenant."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": test_tenant_id, "status": "ACTIVE"})
+        await remote_storage.get("liens", "l1", test_tenant_id)
+        # Another tenant's document replaces it after it was cached
+        db.seed("liens", "l1", {"tenant_id": "other_tenant", "status": "ACTIVE"})
+        db.calls.clear()
+
+        assert not await remote_storage.update("liens", "l1", {"status": "REDEEMED"}, test_tenant_id)
+
+        assert db.rpcs("get") == ["l1"]
+        assert db.docs[("liens", "l1")]["status"] == "ACTIVE"
+
+    @pytest.mark.asyncio
+    async def test_update_stale_cache_missing_document(self, remote_storage, test_tenant_id):
+        """Test that a document deleted after caching (NotFound) falls back and fails."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": test_tenant_id})
+        await remote_storage.get("liens", "l1", test_tenant_id)
+        del db.docs[("liens", "l1")]
+
+        assert not await remote_storage.update("liens", "l1", {"status": "REDEEMED"}, test_tenant_id)
+        assert ("liens", "l1") not in db.docs
+        assert ("liens", "l1") not in remote_storage._owner_cache
+
+    @pytest.mark.asyncio
+    async def test_update_cached_other_tenant(self, remote_storage, test_tenant_id):
+        """Test that a document cached as another tenant's is not updated."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": "other_tenant", "status": "ACTIVE"})
+        await remote_storage.get("liens", "l1", "other_tenant")
+        db.calls.clear()
+
+        assert not await remote_storage.update("liens", "l1", {"status": "REDEEMED"}, test_tenant_id)
+
+        assert db.rpcs("update") == []
+        assert db.docs[("liens", "l1")]["status"] == "ACTIVE"
+
+    @pytest.mark.asyncio
+    async def test_delete_cached_owner_skips_read(self, remote_storage, test_tenant_id):
+        """Test that a delete after get() is a single conditional delete."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": test_tenant_id})
+        await remote_storage.get("liens", "l1", test_tenant_id)
+        db.calls.clear()
+
+        assert await remote_storage.delete("liens", "l1", test_tenant_id)
+
+        assert db.calls == [("delete", "l1")]
+        assert ("liens", "l1") not in db.docs
+
+    @pytest.mark.asyncio
+    async def test_delete_stale_cache_rechecks_owner(self, remote_storage, test_tenant_id):
+        """Test that a delete with a stale cache entry re-verifies the tenant."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": test_tenant_id})
+        await remote_storage.get("liens", "l1", test_tenant_id)
+        db.seed("liens", "l1", {"tenant_id": "other_tenant"})
+        db.calls.clear()
+
+        assert not await remote_storage.delete("liens", "l1", test_tenant_id)
+
+        assert db.rpcs("get") == ["l1"]
+        assert db.docs[("liens", "l1")]["tenant_id"] == "other_tenant"
+
+    @pytest.mark.asyncio
+    async def test_delete_cached_other_tenant(self, remote_storage, test_tenant_id):
+        """Test that a document cached as another tenant's is not deleted."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": "other_tenant"})
+        await remote_storage.get("liens", "l1", "other_tenant")
+        db.calls.clear()
+
+        assert not await remote_storage.delete("liens", "l1", test_tenant_id)
+
+        assert db.rpcs("delete") == []
+        assert ("liens", "l1") in db.docs
+
+    @pytest.mark.asyncio
+    async def test_update_many_refreshes_cache(self, remote_storage, test_tenant_id):
+        """Test that an update after update_many still takes the fast path."""
+        db = remote_storage.db
+        db.seed("liens", "l1", {"tenant_id": test_tenant_id, "status": "ACTIVE"})
+        await remote_storage.update_many("liens", {"l1": {"status": "REDEEMED"}}, test_tenant_id)
+        db.calls.clear()
+
+        assert await remote_storage.update("liens", "l1", {"status": "ACTIVE"}, test_tenant_id)
+
+        assert db.calls == [("update", "l1")]
+        assert db.docs[("liens", "l1")]["status"] == "ACTIVE"
+
+    @pytest.mark.asyncio
+    async def test_create_many_chunks_batches(self, remote_storage, test_tenant_id):
+        """Test that bulk creates are committed in batches of at most 500 writes."""
+        db = remote_storage.db
+
+        doc_ids = await remote_storage.create_many(
+            "liens", [{"n": n} for n in range(1203)], test_tenant_id
+        )
+
+        assert db.commits == [500, 500, 203]
+        assert len(set(doc_ids)) == 1203
+        # IDs come back in input order
+        assert [db.docs[("liens", doc_id)]["n"] for doc_id in doc_ids] == list(range(1203))
+        assert all(db.docs[("liens", doc_id)]["tenant_id"] == test_tenant_id for doc_id in doc_ids)
+
+    @pytest.mark.asyncio
+    async def test_update_many_skips_other_tenants(self, remote_storage, test_tenant_id):
+        """Test that only the tenant's documents are updated, with results in input order."""
+        db = remote_storage.db
+        db.seed("liens", "mine1", {"tenant_id": test_tenant_id, "status": "ACTIVE"})
+        db.seed("liens", "theirs", {"tenant_id": "other_tenant", "status": "ACTIVE"})
+        db.seed("liens", "mine2", {"tenant_id": test_tenant_id, "status": "ACTIVE"})
+
+        results = await remote_storage.update_many(
+            "liens",
+            {
+                "theirs": {"status": "REDEEMED"},
+                "mine1": {"status": "REDEEMED", "tenant_id": "other_tenant"},
+                "missing": {"status": "REDEEMED"},
+                "mine2": {"status": "REDEEMED"},
+            },
+            test_tenant_id
+        )
+
+        assert results == [False, True, False, True]
+        assert db.commits == [2]
+        assert db.docs[("liens", "theirs")]["status"] == "ACTIVE"
+        assert db.docs[("liens", "mine1")]["status"] == "REDEEMED"
+        # tenant_id can't be changed through an update
+        assert db.docs[("liens", "mine1")]["tenant_id"] == test_tenant_id
+        assert db.docs[("liens", "mine2")]["status"] == "REDEEMED"
+        assert ("liens", "missing") not in db.docs
+
+    @pytest.mark.asyncio
+    async def test_update_many_chunks_batches(self, remote_storage, test_tenant_id):
+        """Test that bulk updates are committed in batches of at most 500 writes."""
+        db = remote_storage.db
+        for n in range(501):
+            db.seed("liens", f"l{n}", {"tenant_id": test_tenant_id, "n": n})
+
+        results = await remote_storage.update_many(
+            "liens", {f"l{n}": {"n": -n} for n in range(501)}, test_tenant_id
+        )
+
+        assert results == [True] * 501
+        assert db.commits == [500, 1]
+        assert db.docs[("liens", "l500")]["n"] == -500
+
+    @pytest.mark.asyncio
+    async def test_server_timestamp_stays_in_written_payload(self, remote_storage, test_tenant_id):
+        """Test that SERVER_TIMESTAMP is written to Firestore but never left in the caller's dicts."""
+        from google.cloud.firestore import SERVER_TIMESTAMP
+
+        db = remote_storage.db
+        data = {"status": "ACTIVE"}
+        batch_items = [{"status": "ACTIVE"}]
+
+        doc_id = await remote_storage.create("liens", data, test_tenant_id)
+        [batch_id] = await remote_storage.create_many("liens", batch_items, test_tenant_id)
+
+        for caller_dict, written_id in ((data, doc_id), (batch_items[0], batch_id)):
+            written = db.docs[("liens", written_id)]
+            assert written["created_at"] is SERVER_TIMESTAMP
+            assert written["updated_at"] is SERVER_TIMESTAMP
+            assert isinstance(caller_dict["created_at"], datetime)
+            assert isinstance(caller_dict["updated_at"], datetime)
+            assert SERVER_TIMESTAMP not in caller_dict.values()
+
+        updates = {"status": "REDEEMED"}
+        many_updates = {batch_id: {"status": "REDEEMED"}}
+        assert await remote_storage.update("liens", doc_id, updates, test_tenant_id)
+        assert await remote_storage.update_many("liens", many_updates, test_tenant_id) == [True]
+
+        for caller_dict, written_id in ((updates, doc_id), (many_updates[batch_id], batch_id)):
+            assert db.docs[("liens", written_id)]["updated_at"] is SERVER_TIMESTAMP
+            assert isinstance(caller_dict["updated_at"], datetime)
+            assert SERVER_TIMESTAMP not in caller_dict.values()
+
+    @pytest.mark.asyncio
+    async def test_get_many_empty(self, remote_storage, test_tenant_id):
+        """Test that an empty get_many makes no RPC."""
+        assert await remote_storage.get_many("liens", [], test_tenant_id) == []
+        assert remote_storage.db.calls == []
+
+    @pytest.mark.asyncio
+    async def test_get_many_order_and_duplicates(self, remote_storage, test_tenant_id):
+        """Test that results follow doc_ids, whatever order Firestore returns them in."""
+        db = remote_storage.db
+        for doc_id in ("l1", "l2", "l3"):
+            db.seed("liens", doc_id, {"tenant_id": test_tenant_id, "name": doc_id})
+        db.seed("liens", "theirs", {"tenant_id": "other_tenant", "name": "theirs"})
+
+        docs = await remote_storage.get_many(
+            "liens", ["l3", "l1", "missing", "l3", "theirs", "l2"], test_tenant_id
+        )
+
+        assert [doc and doc["name"] for doc in docs] == ["l3", "l1", None, "l3", None, "l2"]
+        # One batched read, each distinct document requested once
+        assert db.calls == [("get_all", 5)]
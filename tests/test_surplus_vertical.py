@@ -1,27 +1,25 @@
 import pytest
-import sys
-from unittest.mock import MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from datetime import date, datetime
 from decimal import Decimal
 
-# Mock google.adk dependencies
-if "google.adk" not in sys.modules:
-    sys.modules["google.adk"] = MagicMock()
-    sys.modules["google.adk.agents"] = MagicMock()
-    sys.modules["google.adk.types"] = MagicMock()
-    sys.modules["google.adk.apps"] = MagicMock()
-    sys.modules["google.adk.apps.app"] = MagicMock()
-
 from agents.surplus_tracker.agent import SurplusTrackerAgent
 from core.data_models import AssetType
 
+@pytest.fixture(scope="module")
+def surplus_agent_with_storage():
+    """One agent per module; tests reset the storage mock they use."""
+    storage = SimpleNamespace(create=AsyncMock(), query=AsyncMock(), get=AsyncMock())
+    return SurplusTrackerAgent(storage=storage), storage
+
 @pytest.mark.asyncio
-async def test_create_surplus_fund():
+async def test_create_surplus_fund(surplus_agent_with_storage):
     # Setup
-    storage = MagicMock()
-    storage.create = AsyncMock(return_value=None)
+    agent, storage = surplus_agent_with_storage
+    storage.create.reset_mock()
+    storage.create.return_value = None
     
-    agent = SurplusTrackerAgent(storage=storage)
     tenant_id = "test-tenant"
     
     params = {
@@ -58,16 +56,16 @@ async def test_create_surplus_fund():
     assert saved_data["foreclosure_date"] == "2023-01-01"
 
 @pytest.mark.asyncio
-async def test_list_surplus_funds():
+async def test_list_surplus_funds(surplus_agent_with_storage):
     # Setup
-    storage = MagicMock()
+    agent, storage = surplus_agent_with_storage
     mock_surplus = [
         {"id": "s1", "surplus_amount": 1000.0, "county": "C1"},
         {"id": "s2", "surplus_amount": 2000.0, "county": "C2"}
     ]
-    storage.query = AsyncMock(return_value=mock_surplus)
+    storage.query.reset_mock()
+    storage.query.return_value = mock_surplus
     
-    agent = SurplusTrackerAgent(storage=storage)
     tenant_id = "test-tenant"
     
     # Execute